@@ -1,4 +1,7 @@
 # enterprise_rating/ast_decoder/ast_nodes.py
+"""AST node dataclasses. The parsers build RawNode, CompareNode, ArithmeticNode and FunctionNode
+positionally, so the declared field order of those classes is relied on and must not change.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +10,7 @@ from dataclasses import dataclass, field
 from enterprise_rating.ast_decoder.defs import InsType
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     """Common fields for _all_ AST nodes.
     - step       : the step number (n)
@@ -24,7 +27,7 @@ class ASTNode:
     step_type: InsType | None = field(default=None,   kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class RawNode(ASTNode):
     """A simple leaf node carrying a single value (literal or variable)."""
 
@@ -32,7 +35,7 @@ class RawNode(ASTNode):
     value: str
     type: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class CompareNode(ASTNode):
     """Represents a binary comparison: left ∘ right (e.g. GI_84 > GC_47)."""
 
@@ -57,11 +60,11 @@ class Step:
             return ""
         # cache the concatenation
         if self._english is None:
-            parts = [n.english for n in self.nodes if getattr(n, "english", "")]
+            parts = [n.english for n in self.nodes if n.english]
             self._english = " ".join(parts)
         return self._english
 
-@dataclass
+@dataclass(slots=True)
 class IfNode(ASTNode):
     """An IF node with a CompareNode condition and two branches."""
 
@@ -70,7 +73,7 @@ class IfNode(ASTNode):
     condition: CompareNode | MultiConditionNode | TypeCheckNode | None = field(default=None,   kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiConditionNode(ASTNode):
     """Holds multiple CompareNode conditions joined by a single operator (“OR”/^ or “AND”/+).
     """
@@ -80,7 +83,7 @@ class MultiConditionNode(ASTNode):
     cond_op: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArithmeticNode(ASTNode):
     """Represents an arithmetic computation: left ∘ right [round_spec]."""
 
@@ -91,7 +94,7 @@ class ArithmeticNode(ASTNode):
     round_english: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionNode(ASTNode):
     """A generic function or call (e.g. string concat, date-diff, data-source)."""
 
@@ -100,7 +103,7 @@ class FunctionNode(ASTNode):
     round_spec: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentNode(ASTNode):
     """Represents a SET_STRING or similar:
     var := expr
@@ -112,7 +115,7 @@ class AssignmentNode(ASTNode):
     next_true:  list[ASTNode] | None = None
     next_false: list[ASTNode] | None = None
 
-@dataclass
+@dataclass(slots=True)
 class JumpNode(ASTNode):
     """Represents a jump to another step in the program.
     - target_step: the step number to jump to
@@ -121,7 +124,7 @@ class JumpNode(ASTNode):
 
     target: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class TypeCheckNode(ASTNode):
     """Represents a unary type‐check (date / numeric / alpha) on a single variable.
     """
@@ -1,16 +1,20 @@
 # enterprise_rating/ast_decoder/decoder.py
 
+from collections.abc import Iterable
+
 from enterprise_rating.ast_decoder.helpers.ins_helpers import get_ins_type_def
 from enterprise_rating.entities.algorithm import Algorithm
 from enterprise_rating.entities.dependency import DependencyBase
 from enterprise_rating.entities.program_version import ProgramVersion
 
+from .helpers.raw_ins import RawIns
+from .helpers.var_lookup import desc_cache_scope
 from .parser import parse
 from .tokenizer import tokenize
 
 
 def decode_ins(
-    raw_ins: dict,
+    raw_ins: dict | RawIns,
     algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
     program_version: ProgramVersion | None = None,
     dep_item: DependencyBase | None = None,
@@ -21,7 +25,8 @@ def decode_ins(
     produce a best-effort AST without doing any jumps or lookups.
 
     Args:
-      raw_ins        dict of instruction fields (keys: 'n','t','ins','ins_tar','seq_t','seq_f')
+      raw_ins        dict of instruction fields (keys: 'n','t','ins','ins_tar','seq_t','seq_f'),
+                     or an already-coerced RawIns
       algorithm_or_dependency  an Algorithm object or a Dependency object (or None)
       program_version a ProgramVersion object (or None)
 
@@ -34,11 +39,53 @@ def decode_ins(
         # If the AST is already present, return it directly
     #    return existing
 
-    ins_str = raw_ins.get("ins", "") or ""
+    # Coerce the dict once; everything downstream reads fixed RawIns fields
+    if not isinstance(raw_ins, RawIns):
+        raw_ins = RawIns.from_dict(raw_ins)
+
+    ins_str = raw_ins.ins
 
-    ins_type = get_ins_type_def(raw_ins.get("t"))
+    ins_type = get_ins_type_def(raw_ins.t)
 
-    ins_target = raw_ins.get("ins_tar", "")
+    ins_target = raw_ins.ins_tar
 
     tokens = tokenize(ins_str, ins_type, ins_target)
     return parse(tokens, raw_ins, algorithm_or_dependency, program_version, dep_item)
+
+
+def decode_batch(
+    raw_ins_list: Iterable[dict | RawIns],
+    algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
+    program_version: ProgramVersion | None = None,
+    dep_item: DependencyBase | None = None,
+) -> list[list]:
+    """decode_ins over a whole step list sharing one algorithm/dependency and program version.
+    Returns one node list per instruction, in input order; errors propagate as in decode_ins.
+    """
+    # one description memo for the whole list
+    with desc_cache_scope():
+        return [
+            decode_ins(raw_ins, algorithm_or_dependency, program_version, dep_item) for raw_ins in raw_ins_list
+        ]
+
+
+def decode_algorithm(
+    raw_ins_list: Iterable[dict | RawIns],
+    algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
+    program_version: ProgramVersion | None = None,
+    dep_item: DependencyBase | None = None,
+) -> dict[int, list]:
+    """Decode every step of an algorithm once and index the node lists by step number.
+    IF / assignment branches keep their JumpNode targets; resolve one with
+    ``nodes_by_step.get(jump.target, [])`` instead of decoding the target step again.
+    Raises ValueError if two instructions share a step number.
+    """
+    raw_list = [r if isinstance(r, RawIns) else RawIns.from_dict(r) for r in raw_ins_list]
+    decoded = decode_batch(raw_list, algorithm_or_dependency, program_version, dep_item)
+
+    nodes_by_step: dict[int, list] = {}
+    for r, nodes in zip(raw_list, decoded, strict=True):
+        if r.n in nodes_by_step:
+            raise ValueError(f"Duplicate step number {r.n} in algorithm")
+        nodes_by_step[r.n] = nodes
+    return nodes_by_step
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from enterprise_rating.ast_decoder.defs import InsType
 
 
@@ -16,23 +18,27 @@ def decode_filter_rule(filter_rule: str, dependency_var_writer, dependency_list)
     pass
 
 
+_OPERATOR_ENGLISH = {
+    '=': 'equals',
+    '>': 'greater than',
+    '<': 'less than',
+    '<=': 'less than or equal to',
+    '>=': 'greater than or equal to',
+    '!=': 'not equal to',
+    '<>': 'not equal to',
+    '@': 'bitwise AND',
+    '^': 'bitwise OR'
+}
+
+
+@lru_cache(maxsize=128)
 def get_operator_english(oper: str) -> str:
     """Stub for GetOperatorEnglish: maps symbol to English phrase.
     """
-    mapping = {
-        '=': 'equals',
-        '>': 'greater than',
-        '<': 'less than',
-        '<=': 'less than or equal to',
-        '>=': 'greater than or equal to',
-        '!=': 'not equal to',
-        '<>': 'not equal to',
-        '@': 'bitwise AND',
-        '^': 'bitwise OR'
-    }
-    return mapping.get(oper, oper)
+    return _OPERATOR_ENGLISH.get(oper, oper)
 
 
+@lru_cache(maxsize=128)
 def get_round_english(round_spec: str) -> str:
     """Stub for GetRoundEnglish: describes rounding spec in English.
     """
@@ -74,14 +80,16 @@ def get_next_step_english(next_step: str, current_ins_number: int) -> str:
     return f'Step {next_step}'
 
 
-def get_ins_type_def(ins_type: str | None) -> InsType:
+# value -> member, so decoding a type code is one dict hit instead of Enum.__call__
+_INS_BY_VALUE: dict[int, InsType] = {m.value: m for m in InsType}
+
+
+def get_ins_type_def(ins_type: str | int | None) -> InsType:
     """Safely decode instruction type from string to InsType enum."""
     if ins_type is None:
         return InsType.UNKNOWN
 
     try:
-        ins_type_def = InsType(int(ins_type))
+        return _INS_BY_VALUE.get(int(ins_type), InsType.UNKNOWN)
     except (ValueError, TypeError):
-        ins_type_def = InsType.UNKNOWN
-
-    return ins_type_def
+        return InsType.UNKNOWN
@@ -0,0 +1,48 @@
+import logging
+from typing import NamedTuple
+
+from enterprise_rating.ast_decoder.defs import InsType
+
+logger = logging.getLogger(__name__)
+
+
+def _maybe_int(v: object) -> int | None:
+    """Convert v with int(). None and "" mean the field is absent; any other value int()
+    rejects is logged and treated as absent too.
+    """
+    if v is None or v == "":
+        return None
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        logger.warning("Ignoring non-integer instruction field value %r", v)
+        return None
+
+
+class RawIns(NamedTuple):
+    """One instruction's fields, coerced once from the XML dict by from_dict."""
+
+    n: int                 # step number
+    t: int                 # instruction type code (InsType.UNKNOWN.value if unparseable)
+    ins: str               # raw instruction string, "" when absent
+    ins_tar: str | None    # instruction target (optional)
+    seq_t: int | None      # next step when true (optional)
+    seq_f: int | None      # next step when false (optional)
+
+    @classmethod
+    def from_dict(cls, raw_ins: dict) -> "RawIns":
+        """Coerce an instruction dict ('n','t','ins','ins_tar','seq_t','seq_f') once,
+        so the parsers read fixed fields instead of repeating .get() + int() per access.
+        """
+        t = _maybe_int(raw_ins.get("t"))
+        if t is None:
+            t = InsType.UNKNOWN.value
+
+        return cls(
+            n=int(raw_ins.get("n", 0)),
+            t=t,
+            ins=raw_ins.get("ins", "") or "",
+            ins_tar=raw_ins.get("ins_tar", ""),
+            seq_t=_maybe_int(raw_ins.get("seq_t")),
+            seq_f=_maybe_int(raw_ins.get("seq_f")),
+        )
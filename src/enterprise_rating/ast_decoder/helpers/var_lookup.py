@@ -1,5 +1,9 @@
 # enterprise_rating/ast_decoder/helpers/var_lookup.py
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from enterprise_rating.ast_decoder.defs import split_var_token
 from enterprise_rating.entities.algorithm import Algorithm
 from enterprise_rating.entities.dependency import DependencyBase
@@ -45,6 +49,73 @@ def get_target_var_desc(target_var: str,dep: Algorithm | DependencyBase | None =
     return target_var
 
 
+class _DecodePass:
+    """Memo for one decode pass (see desc_cache_scope): get_var_desc results and dependency
+    indexes, keyed on the identity of deps / program_version (a list is not hashable). Each entry
+    also holds those objects so their ids cannot be reused while the pass is running.
+    """
+
+    __slots__ = ("dep_indexes", "descs")
+
+    def __init__(self) -> None:
+        self.descs: dict[tuple, tuple[str, object, object]] = {}
+        self.dep_indexes: dict[int, tuple[dict[tuple[str, int | None], DependencyBase], object]] = {}
+
+
+_DECODE_PASS: ContextVar[_DecodePass | None] = ContextVar("_DECODE_PASS", default=None)
+
+
+@contextmanager
+def desc_cache_scope() -> Iterator[None]:
+    """Memoize get_var_desc_cached and the dependency lookup indexes for the duration of the block,
+    i.e. one decode pass over a ProgramVersion or step list whose dependencies and program version
+    are not modified meanwhile. The memo is dropped on exit; a nested scope reuses the enclosing one.
+    """
+    if _DECODE_PASS.get() is not None:
+        yield
+        return
+    token = _DECODE_PASS.set(_DecodePass())
+    try:
+        yield
+    finally:
+        _DECODE_PASS.reset(token)
+
+
+# Dependency kinds get_var_desc looks up: kind -> (ib_type check, field the variable id matches).
+# Inside a desc_cache_scope each deps list gets one (kind, key) -> first-match index per pass;
+# outside one a lookup scans the list and stops at the first match.
+_TABLE, _RESULT, _CALCULATED = "table", "result", "calculated"
+_DEP_KINDS = {
+    _TABLE: (DependencyBase.is_table_variable, "index"),
+    _RESULT: (DependencyBase.is_result_variable, "index"),
+    _CALCULATED: (DependencyBase.is_calculated_variable, "calc_index"),
+}
+
+
+def _find_dep(deps: list[Algorithm | DependencyBase], kind: str, key: int | None) -> DependencyBase | None:
+    decode_pass = _DECODE_PASS.get()
+    if decode_pass is None:
+        is_kind, field = _DEP_KINDS[kind]
+        for dep in deps:
+            if isinstance(dep, DependencyBase) and is_kind(dep) and getattr(dep, field) == key:
+                return dep
+        return None
+
+    entry = decode_pass.dep_indexes.get(id(deps))
+    if entry is None:
+        index: dict[tuple[str, int | None], DependencyBase] = {}
+        for dep in deps:
+            if not isinstance(dep, DependencyBase):
+                continue
+            for dep_kind, (is_kind, field) in _DEP_KINDS.items():
+                # setdefault keeps the first match, as the scan does
+                if is_kind(dep):
+                    index.setdefault((dep_kind, getattr(dep, field)), dep)
+        entry = (index, deps)
+        decode_pass.dep_indexes[id(deps)] = entry
+    return entry[0].get((kind, key))
+
+
 def get_var_desc(
     target_var: str,
     token_type: str | None = None,
@@ -119,25 +190,37 @@ def get_var_desc(
     if deps is not None:
         # 5b) PL → Program Lookup Vars (table: LookupVarExt filtered by prog_id and line_id)
         if prefix in {"PL", "GL", "PQ", "GQ"}:
-            for dep in deps:  # Pydantic list of LookupVarExt
-                if isinstance(dep, DependencyBase) and dep.is_table_variable() and dep.index == var_id:
-                    return getattr(dep, "description", target_var) or target_var
-            return target_var
+            dep = _find_dep(deps, _TABLE, var_id)
+            return (dep.description or target_var) if dep is not None else target_var
 
         # 5d) GR / PR → Global Result Vars
         if prefix in {"GR", "PR"}:
-            for dep in deps:  # Pydantic list of LookupVarExt
-                if isinstance(dep, DependencyBase) and dep.is_result_variable() and dep.index == var_id:
-                    return getattr(dep, "description", target_var) or target_var
-            return target_var
+            dep = _find_dep(deps, _RESULT, var_id)
+            return (dep.description or target_var) if dep is not None else target_var
 
         # 5e) PC → Program Calculated Vars (join to instructions-groups for description)
         if prefix in {"PC", "GC", "PP", "GP"}:
-            for dep in deps:  # Pydantic list of LookupVarExt
-                if isinstance(dep, DependencyBase) and dep.is_calculated_variable() and dep.calc_index == var_id:
-                    return getattr(dep, "description", target_var) or target_var
-
-            return target_var
+            dep = _find_dep(deps, _CALCULATED, var_id)
+            return (dep.description or target_var) if dep is not None else target_var
 
     # 5m) If we fall through to here, prefix is unknown or not handled.
     return target_var
+
+
+def get_var_desc_cached(
+    target_var: str,
+    token_type: str | None = None,
+    deps: list[Algorithm | DependencyBase] | None = None,
+    program_version: ProgramVersion | None = None,
+) -> str:
+    """get_var_desc, memoized inside a desc_cache_scope (and a plain call outside one)."""
+    decode_pass = _DECODE_PASS.get()
+    if decode_pass is None:
+        return get_var_desc(target_var, token_type, deps, program_version)
+    key = (target_var, token_type, id(deps), id(program_version))
+    try:
+        return decode_pass.descs[key][0]
+    except KeyError:
+        desc = get_var_desc(target_var, token_type, deps, program_version)
+        decode_pass.descs[key] = (desc, deps, program_version)
+        return desc
@@ -1,27 +1,88 @@
 # noqa: F401, F841, ARG001, E241
 # flake8: noqa: E501
 # pylint: disable=unused-import, unused-variable, unused-argument, missing-module-docstring
+import sys
 from collections.abc import Callable
 
 from enterprise_rating.ast_decoder.defs import MULTI_IF_SYMBOL
-from enterprise_rating.ast_decoder.renderer import render_node
+from enterprise_rating.ast_decoder.renderer import finalize
 from enterprise_rating.entities.algorithm import Algorithm
 from enterprise_rating.entities.dependency import DependencyBase
 from enterprise_rating.entities.program_version import ProgramVersion
 
-from .ast_nodes import (ArithmeticNode, AssignmentNode, ASTNode, CompareNode,
-                        FunctionNode, IfNode, JumpNode, RawNode, TypeCheckNode)
+from .ast_nodes import (
+    ArithmeticNode,
+    AssignmentNode,
+    ASTNode,
+    CompareNode,
+    FunctionNode,
+    IfNode,
+    JumpNode,
+    RawNode,
+    TypeCheckNode,
+)
 from .decode_mif import decode_mif
 from .defs import InsType
 from .helpers.ins_helpers import get_ins_type_def
-from .helpers.var_lookup import get_target_var_desc, get_var_desc
-from .tokenizer import Token
+from .helpers.raw_ins import RawIns
+from .helpers.var_lookup import get_target_var_desc, get_var_desc_cached
+from .tokenizer import TOK_TARGET, TOK_WORD, Token
+
+# Display names for the math/trig function parsers, keyed by InsType. The old name-keyed map also
+# listed "POWER", but InsType has no POWER member and no parser dispatches one, so it is not keyed here.
+_FUNCTION_FRIENDLY: dict[InsType, str] = {
+    InsType.INS_MATH_FUNC_LOG: "Natural Log",
+    InsType.INS_MATH_FUNC_LOG10: "Log Base 10",
+    InsType.INS_MATH_FUNC_EXP: "Exponential",
+    InsType.INS_MATH_FUNC_SQRT: "Square Root",
+    InsType.INS_TRIG_FUNC_COS: "Cosine",
+    InsType.INS_TRIG_FUNC_SIN: "Sine",
+    InsType.INS_TRIG_FUNC_TAN: "Tangent",
+    InsType.INS_TRIG_FUNC_COSH: "Hyperbolic Cosine",
+    InsType.INS_TRIG_FUNC_SINH: "Hyperbolic Sine",
+    InsType.INS_TRIG_FUNC_TANH: "Hyperbolic Tangent",
+}
+
+# Both name tables cover every InsType (the enum is finite), so the parsers index them directly.
+# FunctionNode names: the friendly name, else "INS_MATH_FUNC_EXPE" -> "Ins_Math_Func_Expe"
+_DISPLAY_NAME: dict[InsType, str] = {t: _FUNCTION_FRIENDLY.get(t) or t.name.title() for t in InsType}
+
+# parse_rank_flag action labels ("INS_RANK_CATEGORY_INSTANCE" -> "Ins Rank Category Instance")
+_RANK_FLAG_LABEL: dict[InsType, str] = {t: t.name.replace("_", " ").title() for t in InsType}
+
+# check_type labels for parse_type_check
+_TYPECHECK_MAP = {
+    InsType.INS_IS_DATE:    "date",
+    InsType.INS_IS_NUMERIC: "numeric",
+    InsType.INS_IS_ALPHA:   "alpha",
+}
+
+# Memoized get_var_desc (see helpers/var_lookup.py); same signature
+_desc = get_var_desc_cached
+
+
+# Leading characters get_var_desc translates without needing a "_" (operators, {literal}, [literal])
+_DESC_LEADS = frozenset("{[=<>!@^")
+
+
+def _maybe_desc(
+    target_var: str,
+    token_type: str | None = None,
+    deps: list[Algorithm | DependencyBase] | None = None,
+    program_version: ProgramVersion | None = None,
+) -> str:
+    """_desc, short-circuited for values get_var_desc would return unchanged: empty cells and
+    plain literals/numbers (no "_" so not a variable, and not an operator or bracketed literal).
+    """
+    if not target_var or ("_" not in target_var and target_var[0] not in _DESC_LEADS):
+        return target_var
+    return _desc(target_var, token_type, deps, program_version)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse(
     tokens: list[Token],
-    raw_ins: dict,
+    raw_ins: RawIns,
     algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
     program_version: ProgramVersion | None = None,
     dep_item: DependencyBase | None = None,
@@ -30,8 +91,8 @@ def parse(
     Supports algorithm_or_dependency=None or program_version=None by skipping any lookups/jumps.
 
     Args:
-      tokens: list of Token objects (from tokenize(raw_ins['ins'])).
-      raw_ins: dict of instruction fields ('n','t','ins','ins_tar','seq_t','seq_f', etc.).
+      tokens: list of Token objects (from tokenize(raw_ins.ins)).
+      raw_ins: RawIns record of instruction fields (n, t, ins, ins_tar, seq_t, seq_f).
       algorithm_or_dependency: an Algorithm object or a Dependency object (or None).
       program_version: a ProgramVersion object (or None).
 
@@ -39,124 +100,48 @@ def parse(
       List[ASTNode]: The parsed AST nodes for the instruction.
 
     """
-    ins_type = get_ins_type_def(raw_ins.get("t"))  # type: InsType
-
-    step = int(raw_ins.get("n", 0))
-    ins_str = raw_ins.get("ins", "") or ""
-
-    # 3) InsType dispatch map
-    # noqa: E241
-    dispatch_map: dict[InsType, tuple[Callable, str]] = {
-        InsType.DEF_INS_TYPE_ARITHEMETIC: (parse_arithmetic, "ASSIGNMENT"),      # 0
-        InsType.DEF_INS_TYPE_NUMERIC_IF: (parse_if, "IF_COMPARE"),               # 1
-        InsType.DEF_INS_TYPE_CALL: (parse_call, "FUNCTION_CALL"),                # 2
-        InsType.SORT: (parse_sort, "FUNCTION_CALL"),                             # 3
-        InsType.DEF_INS_TYPE_MASK: (parse_mask, "MASK"),                         # 4
-        InsType.SET_STRING: (parse_set_string, "ASSIGNMENT"),                    # 5
-        InsType.EMPTY: (parse_empty, "EMPTY"),                                   # 6
-        InsType.INS_STR_CONCAT: (parse_string_addition, "STRING_CONCAT"),        # 86
-        InsType.DATE_DIFF_DAYS: (parse_date_diff, "DATE_DIFF"),                  # 57
-        InsType.DATE_DIFF_MONTHS: (parse_date_diff, "DATE_DIFF"),                # 58
-        InsType.DATE_DIFF_YEARS: (parse_date_diff, "DATE_DIFF"),                 # 59
-        InsType.INS_DATE_ADDITION: (parse_date_addition, "DATE_DIFF"),           # 126
-        InsType.INS_MATH_FUNC_EXP: (parse_function, "FUNCTION_CALL"),            # 127
-        InsType.INS_MATH_FUNC_LOG: (parse_function, "FUNCTION_CALL"),            # 128
-        InsType.INS_MATH_FUNC_LOG10: (parse_function, "FUNCTION_CALL"),          # 129
-        InsType.INS_MATH_FUNC_EXPE: (parse_function, "FUNCTION_CALL"),           # 130
-        InsType.INS_MATH_FUNC_SQRT: (parse_function, "FUNCTION_CALL"),           # 133
-        InsType.INS_TRIG_FUNC_COS: (parse_function, "FUNCTION_CALL"),            # 138
-        InsType.INS_TRIG_FUNC_SIN: (parse_function, "FUNCTION_CALL"),            # 142
-        InsType.INS_TRIG_FUNC_TAN: (parse_function, "FUNCTION_CALL"),            # 146
-        InsType.INS_TRIG_FUNC_COSH: (parse_function, "FUNCTION_CALL"),           # 139
-        InsType.INS_TRIG_FUNC_SINH: (parse_function, "FUNCTION_CALL"),           # 143
-        InsType.INS_TRIG_FUNC_TANH: (parse_function, "FUNCTION_CALL"),           # 147
-        InsType.INS_QUERY_DATA_SOURCE: (parse_data_source, "QUERY_DATA_SOURCE"), # 200
-        InsType.INS_RANK_CATEGORY_INSTANCE: (parse_rank_flag, "RANK_FLAG"),      # 94
-        InsType.INS_RANK_CATEGORY_AVAILABLE: (parse_rank_flag, "RANK_ACROSS_CATEGORY_ALL_AVAILABLE_ALT"), # 93
-        InsType.DEF_INS_TYPE_SET_UNDERWRITING_TO_FAIL: (parse_empty, "SET_UNDERWRITING_TO_FAIL"), # 254
-        InsType.INS_IS_DATE: (parse_type_check, "IS_DATE"),                      # 95
-        InsType.INS_IS_NUMERIC: (parse_type_check, "IS_NUMERIC"),                # 98
-        InsType.INS_IS_ALPHA: (parse_type_check, "IS_ALPHA"),                    # 99
-        # ...continue for all needed types...
-    }
-
-    parser_func_tuple = dispatch_map.get(ins_type) if ins_type is not None else None
-    if parser_func_tuple is not None:
-        parser_func, template_id = parser_func_tuple
-
-        # 1) If there's a '#' anywhere, jump to decode_mif
-        if MULTI_IF_SYMBOL in ins_str or "^" in ins_str or "+" in ins_str:
-            return decode_mif(raw_ins, algorithm_or_dependency, program_version, template_id)
-
-        # 2) Otherwise, if this is a plain IF, call parse_if
-        if ins_type == InsType.DEF_INS_TYPE_NUMERIC_IF:
-            return parse_if(tokens, raw_ins, algorithm_or_dependency, program_version, template_id)
-
-        # Some parsers need raw_ins + algorithm_or_dependency + program_version
-        if parser_func in (parse_if, parse_if_date, parse_data_source, parse_type_check):
-            return parser_func(tokens, raw_ins, algorithm_or_dependency, program_version, template_id)  # type: ignore
-
-        ins_target = get_target_var_desc(raw_ins.get("ins_tar", ""), dep_item)
-
-        ast_nodes = parser_func(tokens, step, ins_type, ins_target, algorithm_or_dependency, program_version, template_id)  # type: ignore
-
-        if isinstance(ast_nodes, list) and ast_nodes and isinstance(ast_nodes[0], AssignmentNode):
-            ast_node = ast_nodes[0]
-
-            ast_node.next_true = [
-                JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=raw_ins.get("seq_t"))
-            ]
-
-            ast_node.next_false = [
-                JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=raw_ins.get("seq_f"))
-            ]
-
-            ast_node.english = render_node(ast_node)  # Render the English description
-
-        return ast_nodes
-
-    # 4) Fallback: if no InsType matched, produce a RawNode
-    desc = get_var_desc(ins_str, None, algorithm_or_dependency, program_version)
-    return [RawNode(step=step, ins_type=ins_type, raw=ins_str, value=desc)]
+    ins_type = get_ins_type_def(raw_ins.t)  # type: InsType
 
+    step = raw_ins.n
+    ins_str = raw_ins.ins
 
-# ──────────────────────────────────────────────────────────────────────────────
-def parse_rank_flag(
-    tokens: list[Token],
-    step: int,
-    ins_type: InsType,
-    ins_target: str,
-    algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
-    program_version: ProgramVersion | None = None,
-    template_id: str = "",
-) -> list[ASTNode]:
-    """Generic parser for any InsType whose name begins with 'RANK' or 'FLAG'.
-    If algorithm_or_dependency or program_version is None, we skip get_var_desc lookups.
-    """
-    action_text = ins_type.name.replace("_", " ").title()
-
-    vars_expanded = []
-    for t in tokens:
-        if (
-            program_version is not None
-            and algorithm_or_dependency is not None
-            and t.type == "WORD"
-            and ("GI_" in t.value or "GC_" in t.value)
-        ):
-            vars_expanded.append(get_var_desc(t.value, t.type, algorithm_or_dependency, program_version))
-        else:
-            vars_expanded.append(t.value)
+    # 1) Jump-table lookup; every slot holds a parser, unmapped types get _parse_unknown
+    parser_func, template_id = _DISPATCH[ins_type.value + 1]
 
-    if vars_expanded:
-        action_text += ": " + ", ".join(vars_expanded)
+    # 2) If there's a '#' (or '^'/'+') anywhere in a known instruction, jump to decode_mif
+    if parser_func is not _parse_unknown and ("^" in ins_str or "+" in ins_str or MULTI_IF_SYMBOL in ins_str):
+        return decode_mif(raw_ins, algorithm_or_dependency, program_version, template_id, ins_type)
+
+    # The fallback, IF, data-source and type-check parsers never read the target, so only the others resolve it.
+    # A missing ins_tar resolves as "", as an instruction dict without the key always did.
+    if parser_func in _NO_TARGET_PARSERS:
+        ins_target = raw_ins.ins_tar
+    else:
+        ins_target = get_target_var_desc(raw_ins.ins_tar or "", dep_item)
+
+    ast_nodes = parser_func(
+        tokens, raw_ins, step, ins_type, ins_target, algorithm_or_dependency, program_version, template_id
+    )
+
+    if ast_nodes and isinstance(ast_nodes[0], AssignmentNode):
+        ast_node = ast_nodes[0]
 
-    desc = get_var_desc(action_text, None, algorithm_or_dependency, program_version)
-    return [RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=action_text, value=desc)]
+        ast_node.next_true = [
+            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=raw_ins.seq_t)
+        ]
+
+        ast_node.next_false = [
+            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=raw_ins.seq_f)
+        ]
+
+    # 3) Parsers only build structure; render each root once, now that it is fully wired
+    return finalize(ast_nodes)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-def parse_sort(
+def _parse_unknown(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -164,14 +149,16 @@ def parse_sort(
     program_version: ProgramVersion | None = None,
     template_id: str = "",
 ) -> list[ASTNode]:
-    """Stub for Sort instruction."""
-    text = "Sort: " + " ".join(t.value for t in tokens)
-    return [RawNode(step=step, ins_type=ins_type, template_id=template_id, raw="", value=text)]
+    """Fallback for any InsType without a dedicated parser: a single RawNode."""
+    ins_str = raw_ins.ins
+    desc = _desc(ins_str, None, algorithm_or_dependency, program_version)
+    return [RawNode(step, ins_type, ins_str, desc)]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-def parse_mask(
+def parse_rank_flag(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -179,15 +166,60 @@ def parse_mask(
     program_version: ProgramVersion | None = None,
     template_id: str = "",
 ) -> list[ASTNode]:
-    """Stub for Mask instruction."""
-    text = "Mask: " + " ".join(t.value for t in tokens)
+    """Generic parser for any InsType whose name begins with 'RANK' or 'FLAG'.
+    If algorithm_or_dependency or program_version is None, we skip get_var_desc lookups.
+    """
+    action_text = _RANK_FLAG_LABEL[ins_type]
 
-    return [RawNode(step=step, ins_type=ins_type, template_id=template_id, raw="", value=text)]
+    if program_version is None or algorithm_or_dependency is None:
+        vars_expanded = [t.value for t in tokens]
+    else:
+        # tokenize_pipe splits on "|" only, so a cell keeps any "~" / "D" marker in front of the
+        # variable ("~GI_5"); a substring test still finds it there
+        vars_expanded = [
+            _desc(t.value, t.type, algorithm_or_dependency, program_version)
+            if t.type == TOK_WORD and ("GI_" in t.value or "GC_" in t.value)
+            else t.value
+            for t in tokens
+        ]
+
+    if vars_expanded:
+        action_text += ": " + ", ".join(vars_expanded)
+
+    desc = _desc(action_text, None, algorithm_or_dependency, program_version)
+    return [RawNode(step, ins_type, action_text, desc, template_id=template_id)]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+def _stub_parser(prefix: str) -> Callable[..., list[ASTNode]]:
+    """Build a placeholder parser for instructions we only echo back: one RawNode whose value is
+    the label followed by the raw token values (e.g. "Sort: GI_1 GI_2").
+    """
+
+    def _parse_stub(
+        tokens: list[Token],
+        raw_ins: RawIns,
+        step: int,
+        ins_type: InsType,
+        ins_target: str,
+        algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
+        program_version: ProgramVersion | None = None,
+        template_id: str = "",
+    ) -> list[ASTNode]:
+        text = prefix + " ".join([t.value for t in tokens])
+        return [RawNode(step, ins_type, "", text, template_id=template_id)]
+
+    return _parse_stub
+
+
+parse_sort = _stub_parser("Sort: ")  # Stub for Sort instruction
+parse_mask = _stub_parser("Mask: ")  # Stub for Mask instruction
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_empty(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -202,6 +234,7 @@ def parse_empty(
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_set_string(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -213,9 +246,9 @@ def parse_set_string(
     Produces an AssignmentNode where expr is a RawNode(string literal).
     """
     # 1) Build the concat expression
-    target_val = get_var_desc(ins_target, None, algorithm_or_dependency, program_version)
-    args = [RawNode(step, ins_type, raw=t.value,
-                value=target_val if t.type == "TARGET" else get_var_desc(t.value, t.type, algorithm_or_dependency, program_version),type=t.type)
+    target_val = _desc(ins_target, None, algorithm_or_dependency, program_version)
+    args = [RawNode(step, ins_type, t.value,
+                target_val if t.type == TOK_TARGET else _desc(t.value, t.type, algorithm_or_dependency, program_version), t.type)
             for t in tokens]
 
     concat = FunctionNode(
@@ -241,6 +274,7 @@ def parse_set_string(
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_string_addition(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -249,9 +283,9 @@ def parse_string_addition(
     template_id: str = "",
 ) -> list[ASTNode]:
     """Parse String Addition instructions (InsType.STRING_ADDITION)."""
-    target_val = get_var_desc(ins_target, None, algorithm_or_dependency, program_version)
-    args = [RawNode(step, ins_type, raw=t.value,
-                value=target_val if t.type == "TARGET" else get_var_desc(t.value, t.type, algorithm_or_dependency, program_version),type=t.type)
+    target_val = _desc(ins_target, None, algorithm_or_dependency, program_version)
+    args = [RawNode(step, ins_type, t.value,
+                target_val if t.type == TOK_TARGET else _desc(t.value, t.type, algorithm_or_dependency, program_version), t.type)
             for t in tokens]
 
     concat = FunctionNode(
@@ -278,6 +312,7 @@ def parse_string_addition(
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_date_diff(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -288,17 +323,17 @@ def parse_date_diff(
     """Parse DATE_DIFF_* into a FunctionNode; all verbalization happens in renderer.py."""
     # 1) pull out the raw token values
     if len(tokens) >= 2:
-        left_val, right_val = tokens[0].value, tokens[1].value
+        left_val, right_val = sys.intern(tokens[0].value), sys.intern(tokens[1].value)
     else:
-        left_val = tokens[0].value if tokens else ""
+        left_val = sys.intern(tokens[0].value) if tokens else ""
         right_val = ""
 
     # 2) look up their “nice” descriptions, but do *not* build any English sentence here
-    left_desc = get_var_desc(left_val, None, None)
-    right_desc = get_var_desc(right_val, None, None)
+    left_desc = _maybe_desc(left_val, None, None)
+    right_desc = _maybe_desc(right_val, None, None)
 
-    left_node = RawNode(step=step, ins_type=ins_type, raw=left_val, value=left_desc)
-    right_node = RawNode(step=step, ins_type=ins_type, raw=right_val, value=right_desc)
+    left_node = RawNode(step, ins_type, left_val, left_desc)
+    right_node = RawNode(step, ins_type, right_val, right_desc)
 
     # 3) Emit only the structural AST
     func_node = FunctionNode(
@@ -308,13 +343,13 @@ def parse_date_diff(
         template_id=template_id,
         args=[left_node, right_node],
     )
-    func_node.english = render_node(func_node)  # Render the English description
     return [func_node]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_date_addition(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -326,14 +361,14 @@ def parse_date_addition(
     Builds a FunctionNode named "Date Addition" with English = "Add offset to date".
     """
     if len(tokens) >= 2:
-        date_val = tokens[0].value
-        offset_val = tokens[1].value
+        date_val = sys.intern(tokens[0].value)
+        offset_val = sys.intern(tokens[1].value)
     else:
-        date_val = tokens[0].value if tokens else ""
+        date_val = sys.intern(tokens[0].value) if tokens else ""
         offset_val = ""
 
-    date_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=date_val, value=date_val)
-    offset_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=offset_val, value=offset_val)
+    date_node = RawNode(step, ins_type, date_val, date_val, template_id=template_id)
+    offset_node = RawNode(step, ins_type, offset_val, offset_val, template_id=template_id)
 
     func_node = FunctionNode(
         step=step,
@@ -342,82 +377,35 @@ def parse_date_addition(
         template_id=template_id,
         args=[date_node, offset_node],
     )
-    func_node.english = render_node(func_node)  # Render the English description
     return [func_node]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-def parse_if_date(
-    tokens: list[Token],
-    raw_ins: dict,
-    algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
-    program_version: ProgramVersion | None = None,
-    template_id: str = "",
-) -> list[ASTNode]:
-    """Parse IF_DATE instructions (InsType.IF_DATE).
-    Builds a CompareNode inside an IfNode, then wires true/false branches via seq_t/seq_f
-    if algorithm_or_dependency is provided.
+def _split_if(ins_str: str) -> tuple[str, str, str]:
+    """Slice a single IF clause into its raw (left, operator, right) cells.
+    Pure string work with no lookups or node construction, kept apart from parse_if so the
+    classify stage stays separate from building the AST.
     """
-    step = int(raw_ins.get("n", 0))
-    ins_type = InsType(int(raw_ins.get("t", 0)))
-
-    left_val = tokens[0].value if len(tokens) > 0 else ""
-    op_val = tokens[1].value if len(tokens) > 1 else ""
-    right_val = tokens[2].value if len(tokens) > 2 else ""
-
-    left_desc = get_var_desc(left_val, None, algorithm_or_dependency, program_version)
-    left_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=left_val, value=left_desc)
-
-    right_desc = get_var_desc(left_val, None, algorithm_or_dependency, program_version)
-    right_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=right_val, value=right_desc)
-
-    condition = CompareNode(
-        step=step,
-        ins_type=ins_type,
-        left=left_node,
-        template_id=template_id,
-        operator=op_val,
-        right=right_node,
-    )
-    condition.english = render_node(condition)  # Render the English description
-
-    # Next‐step pointers
-    seq_t = raw_ins.get("seq_t")
-    seq_f = raw_ins.get("seq_f")
-
-    next_true = int(seq_t) if seq_t is not None else None
-    next_false = int(seq_f) if seq_f is not None else None
-
-    node = IfNode(
-        step=step, ins_type=ins_type, template_id=template_id, condition=condition, true_branch=[], false_branch=[]
-    )
-    node.english = render_node(node)  # Render the English description
-
-    # True branch
-    if next_true is not None:
-        node.true_branch = [
-            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=next_true)
-        ]
-
-        for branch_node in node.true_branch:
-            branch_node.english = render_node(branch_node)
-
-    # False branch
-    if next_false is not None:
-        node.false_branch = [
-            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=next_false)
-        ]
-
-        for branch_node in node.false_branch:
-            branch_node.english = render_node(branch_node)
-
-    return [node]
+    # "|VAR|OP|VALUE|": skip whatever precedes the first pipe, take the next three cells
+    head, _, rest = ins_str.partition("|")
+    left, sep2, rest = rest.partition("|")
+    op, sep3, rest = rest.partition("|")
+    if sep3:
+        return left, op, rest.partition("|")[0]
+    # Exactly two pipes: bare "VAR|OP|VALUE", so the cells shift left by one
+    if sep2:
+        return head, left, op
+    # If unexpected format, capture entire string as left_val
+    return ins_str, "", ""
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_if(
     tokens: list[Token],
-    raw_ins: dict,
+    raw_ins: RawIns,
+    step: int,
+    ins_type: InsType,
+    ins_target: str,
     algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
     program_version: ProgramVersion | None = None,
     template_id: str = "",
@@ -425,45 +413,25 @@ def parse_if(
     """Parse a single‐clause IF of the form "|VAR|OP|VALUE|" (e.g. "|GR_5370|=|{}|").
     We assume callers (decode_mif or parse) never strip the pipes before we run this.
     """
-    step = int(raw_ins.get("n", 0))
-    ins_type = InsType(int(raw_ins.get("t", 0)))
-    ins_str = raw_ins.get("ins", "") or ""  # e.g. "|~GI_494|<>|GC_691|"
-
-    # 1) Split on '|' – we expect ["", VAR, OP, VALUE, ""]
-    parts = ins_str.split("|")
-    if len(parts) >= 4:
-        left_val = parts[1]
-        operator = get_var_desc(parts[2])
-        right_val = parts[3]
-    elif len(parts) == 3:
-        left_val = parts[0]
-        operator = get_var_desc(parts[1])
-        right_val = parts[2]
-    else:
-        # If unexpected format, capture entire string as left_val
-        left_val = ins_str
-        operator = ""
-        right_val = ""
+    # 1) Slice the raw cells (e.g. "|~GI_494|<>|GC_691|"), then resolve descriptions
+    left_val, operator, right_val = _split_if(raw_ins.ins)
+    left_val, right_val = sys.intern(left_val), sys.intern(right_val)
+    operator = _maybe_desc(operator)
 
-    desc_left = get_var_desc(left_val, None, algorithm_or_dependency, program_version)
-    left_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=left_val, value=desc_left)
-    desc_right = get_var_desc(right_val, None, algorithm_or_dependency, program_version)
-    right_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=right_val, value=desc_right)
+    desc_left = _maybe_desc(left_val, None, algorithm_or_dependency, program_version)
+    left_node = RawNode(step, ins_type, left_val, desc_left, template_id=template_id)
+    desc_right = _maybe_desc(right_val, None, algorithm_or_dependency, program_version)
+    right_node = RawNode(step, ins_type, right_val, desc_right, template_id=template_id)
 
-    condition = CompareNode(
-        step=step, ins_type=ins_type, left=left_node, operator=operator, right=right_node, english=""
-    )
+    condition = CompareNode(step, ins_type, left_node, operator, right_node)
 
     node = IfNode(
-        step=step, ins_type=ins_type, template_id=template_id, condition=condition, true_branch=[], false_branch=[]
+        step=step, ins_type=ins_type, template_id=template_id, condition=condition
     )
 
     # 2) Wire up true/false branches via seq_t / seq_f if available
-    seq_t = raw_ins.get("seq_t")
-    seq_f = raw_ins.get("seq_f")
-
-    next_true = int(seq_t) if seq_t is not None else None
-    next_false = int(seq_f) if seq_f is not None else None
+    next_true = raw_ins.seq_t
+    next_false = raw_ins.seq_f
 
     # True branch
     if next_true is not None:
@@ -477,15 +445,13 @@ def parse_if(
             JumpNode(step=step, ins_type=ins_type, template_id="JUMP", target=next_false)
         ]
 
-    if template_id is not None and template_id != "":
-        node.english = render_node(node)
-
     return [node]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_arithmetic(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -495,46 +461,38 @@ def parse_arithmetic(
 ) -> list[ASTNode]:
     """Parse arithmetic expressions into an ArithmeticNode.
     Expected format: VAR operator VAR [round_spec], where round_spec might be '!RN', etc.
+    A trailing '!'-prefixed round_spec token is sliced off; the caller's list is left as it is.
     """
     round_spec = None
-    if tokens and tokens[-1].value.startswith("!"):
-        round_token = tokens[-1].value
-        round_spec = round_token[1:]
+    if tokens and tokens[-1].value[:1] == "!":
+        round_spec = tokens[-1].value[1:]
         tokens = tokens[:-1]
 
     if len(tokens) >= 3:
-        left_val = tokens[0].value
-        operator = tokens[1].value
-        right_val = tokens[2].value
-
-        left_desc = get_var_desc(left_val, None, algorithm_or_dependency, program_version)
-        left_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=left_val, value=left_desc)
-
-        right_desc = get_var_desc(right_val, None, algorithm_or_dependency, program_version)
-        right_node = RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=right_val, value=right_desc)
-
-        node = ArithmeticNode(
-            step=step,
-            ins_type=ins_type,
-            left=left_node,
-            operator=operator,
-            template_id=template_id,
-            right=right_node,
-            round_spec=round_spec
-        )
-        node.english = render_node(node)
+        left_val = sys.intern(tokens[0].value)
+        operator = sys.intern(tokens[1].value)
+        right_val = sys.intern(tokens[2].value)
+
+        left_desc = _maybe_desc(left_val, None, algorithm_or_dependency, program_version)
+        left_node = RawNode(step, ins_type, left_val, left_desc, template_id=template_id)
+
+        right_desc = _maybe_desc(right_val, None, algorithm_or_dependency, program_version)
+        right_node = RawNode(step, ins_type, right_val, right_desc, template_id=template_id)
+
+        node = ArithmeticNode(step, ins_type, left_node, operator, right_node, round_spec, template_id=template_id)
 
         return [node]
 
     # Fallback
     return [
-        RawNode(step=step, ins_type=ins_type, template_id=template_id, raw="", value=" ".join(t.value for t in tokens))
+        RawNode(step, ins_type, "", " ".join([t.value for t in tokens]), template_id=template_id)
     ]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_function(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -544,34 +502,16 @@ def parse_function(
 ) -> list[ASTNode]:
     """Generic parser for math & trigonometry functions.
     Handles single‐arg (SQRT, LOG, etc.) and two‐arg (POWER, etc.) + optional rounding.
+    A trailing '!'-prefixed round_spec token is sliced off; the caller's list is left as it is.
     """
     round_spec = None
-    if tokens and tokens[-1].value.startswith("!"):
-        round_token = tokens[-1].value
-        round_spec = round_token[1:]
+    if tokens and tokens[-1].value[:1] == "!":
+        round_spec = tokens[-1].value[1:]
         tokens = tokens[:-1]
 
-    args = [RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=t.value, value=t.value) for t in tokens]
-
-    friendly_map = {
-        "POWER": "Power",
-        "LOG": "Natural Log",
-        "LOG10": "Log Base 10",
-        "EXP": "Exponential",
-        "SQRT": "Square Root",
-        "COS": "Cosine",
-        "SIN": "Sine",
-        "TAN": "Tangent",
-        "COSH": "Hyperbolic Cosine",
-        "SINH": "Hyperbolic Sine",
-        "TANH": "Hyperbolic Tangent",
-    }
-    display_name = friendly_map.get(ins_type.name, ins_type.name.title())
+    args = [RawNode(step, ins_type, (v := sys.intern(t.value)), v, template_id=template_id) for t in tokens]
 
-    node = FunctionNode(
-        step=step, ins_type=ins_type, template_id=template_id, name=display_name, args=args, round_spec=round_spec
-    )
-    node.english = render_node(node)  # Render the English description
+    node = FunctionNode(step, ins_type, _DISPLAY_NAME[ins_type], args, round_spec, template_id=template_id)
 
     return [node]
 
@@ -579,6 +519,7 @@ def parse_function(
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_call(
     tokens: list[Token],
+    raw_ins: RawIns,
     step: int,
     ins_type: InsType,
     ins_target: str,
@@ -591,20 +532,21 @@ def parse_call(
         step=step,
         ins_type=ins_type,
         name="CallOut",
-        args=[RawNode(step, ins_type, raw=t.value,
-            value=getattr(t, "description", ""), type=t.type)
+        args=[RawNode(step, ins_type, t.value, getattr(t, "description", ""), t.type)
         for t in tokens
         ],
     )
 
-    node.english = render_node(node)  # Render the English description
     return [node]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 def parse_data_source(
     tokens: list[Token],
-    raw_ins: dict,
+    raw_ins: RawIns,
+    step: int,
+    ins_type: InsType,
+    ins_target: str,
     algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
     program_version: ProgramVersion | None = None,
     template_id: str = "",
@@ -612,26 +554,25 @@ def parse_data_source(
     """Parse DataSource instructions (InsType.DATA_SOURCE).
     If program_version is None, we skip lookups and return a placeholder.
     """
-    step = int(raw_ins.get("n", 0))
-    ins_type = InsType(int(raw_ins.get("t", 0)))
-
     node = FunctionNode(
         step=step,
         ins_type=ins_type,
         name="DataSource",
         args=[
-            RawNode(step=step, ins_type=ins_type, template_id=template_id, raw=tok.value, value=tok.value)
+            RawNode(step, ins_type, (v := sys.intern(tok.value)), v, template_id=template_id)
             for tok in tokens
         ],
     )
 
-    node.english = render_node(node)  # Render the English description
     return [node]
 
 
 def parse_type_check(
     tokens: list[Token],
-    raw_ins: dict,
+    raw_ins: RawIns,
+    step: int,
+    ins_type: InsType,
+    ins_target: str,
     algorithm_or_dependency: list[Algorithm | DependencyBase] | None = None,
     program_version: ProgramVersion | None = None,
     template_id: str = "",
@@ -639,16 +580,13 @@ def parse_type_check(
     """Parse IS_DATE (95), IS_NUMERIC (98), or IS_ALPHA (99):
     Build an IfNode whose condition is a TypeCheckNode, and branches are JumpNodes.
     """
-    step = int(raw_ins.get("n", 0))
-    ins_type = InsType(int(raw_ins.get("t", 0)))
-
     # 1) extract the single variable token
     if tokens and tokens[0].value.startswith("~") and len(tokens) > 1:
-        left_raw = tokens[1].value
+        left_raw = sys.intern(tokens[1].value)
     else:
-        left_raw = tokens[0].value if tokens else ""
+        left_raw = sys.intern(tokens[0].value) if tokens else ""
 
-    left_desc = get_var_desc(left_raw, None, algorithm_or_dependency, program_version)
+    left_desc = _desc(left_raw, None, algorithm_or_dependency, program_version)
     left_node = RawNode(
         step=step,
         ins_type=ins_type,
@@ -659,12 +597,7 @@ def parse_type_check(
     )
 
     # 2) map ins_type to a human‐readable check_type
-    check_map = {
-        InsType.IS_DATE:    "date",
-        InsType.IS_NUMERIC: "numeric",
-        InsType.IS_ALPHA:   "alpha",
-    }
-    check_type = check_map.get(ins_type, ins_type.name.lower())
+    check_type = _TYPECHECK_MAP.get(ins_type) or sys.intern(ins_type.name.lower())
 
     # 3) build the unary condition node
     cond_node = TypeCheckNode(
@@ -676,31 +609,84 @@ def parse_type_check(
         check_type=check_type,
     )
 
-    # 4) wire up true/false branches via seq_t / seq_f
-    seq_t = raw_ins.get("seq_t")
-    seq_f = raw_ins.get("seq_f")
-    true_branch = []
-    false_branch = []
-    if seq_t is not None and int(seq_t) > 0:
-        true_branch = [
-            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", step_type=ins_type,
-                     target=int(seq_t))
-        ]
-    if seq_f is not None and int(seq_f) > 0:
-        false_branch = [
-            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", step_type=ins_type,
-                     target=int(seq_f))
-        ]
-
-    # 5) combine into a single IfNode
+    # 4) combine into a single IfNode
     node = IfNode(
         step=step,
         ins_type=ins_type,
         template_id="TYPE_CHECK",
         step_type=ins_type,
         condition=cond_node,
-        true_branch=true_branch,
-        false_branch=false_branch,
     )
 
+    # 5) wire up true/false branches via seq_t / seq_f
+    seq_t = raw_ins.seq_t
+    seq_f = raw_ins.seq_f
+    if seq_t is not None and seq_t > 0:
+        node.true_branch = [
+            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", step_type=ins_type,
+                     target=seq_t)
+        ]
+    if seq_f is not None and seq_f > 0:
+        node.false_branch = [
+            JumpNode(step=step, ins_type=ins_type, template_id="JUMP", step_type=ins_type,
+                     target=seq_f)
+        ]
+
     return [node]
+
+
+# Parsers parse() calls without resolving ins_tar through get_target_var_desc
+_NO_TARGET_PARSERS = frozenset((_parse_unknown, parse_if, parse_data_source, parse_type_check))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# InsType dispatch: every parser shares the signature
+# (tokens, raw_ins, step, ins_type, ins_target, algorithm_or_dependency, program_version, template_id)
+_PARSERS: dict[InsType, tuple[Callable[..., list[ASTNode]], str]] = {
+    InsType.DEF_INS_TYPE_ARITHEMETIC: (parse_arithmetic, "ASSIGNMENT"),  # 0
+    InsType.DEF_INS_TYPE_NUMERIC_IF: (parse_if, "IF_COMPARE"),  # 1
+    InsType.DEF_INS_TYPE_CALL: (parse_call, "FUNCTION_CALL"),  # 2
+    InsType.SORT: (parse_sort, "FUNCTION_CALL"),  # 3
+    InsType.DEF_INS_TYPE_MASK: (parse_mask, "MASK"),  # 4
+    InsType.SET_STRING: (parse_set_string, "ASSIGNMENT"),  # 5
+    InsType.EMPTY: (parse_empty, "EMPTY"),  # 6
+    InsType.INS_STR_CONCAT: (parse_string_addition, "STRING_CONCAT"),  # 86
+    InsType.DATE_DIFF_DAYS: (parse_date_diff, "DATE_DIFF"),  # 57
+    InsType.DATE_DIFF_MONTHS: (parse_date_diff, "DATE_DIFF"),  # 58
+    InsType.DATE_DIFF_YEARS: (parse_date_diff, "DATE_DIFF"),  # 59
+    InsType.INS_DATE_ADDITION: (parse_date_addition, "DATE_DIFF"),  # 126
+    InsType.INS_MATH_FUNC_EXP: (parse_function, "FUNCTION_CALL"),  # 127
+    InsType.INS_MATH_FUNC_LOG: (parse_function, "FUNCTION_CALL"),  # 128
+    InsType.INS_MATH_FUNC_LOG10: (parse_function, "FUNCTION_CALL"),  # 129
+    InsType.INS_MATH_FUNC_EXPE: (parse_function, "FUNCTION_CALL"),  # 130
+    InsType.INS_MATH_FUNC_SQRT: (parse_function, "FUNCTION_CALL"),  # 133
+    InsType.INS_TRIG_FUNC_COS: (parse_function, "FUNCTION_CALL"),  # 138
+    InsType.INS_TRIG_FUNC_SIN: (parse_function, "FUNCTION_CALL"),  # 142
+    InsType.INS_TRIG_FUNC_TAN: (parse_function, "FUNCTION_CALL"),  # 146
+    InsType.INS_TRIG_FUNC_COSH: (parse_function, "FUNCTION_CALL"),  # 139
+    InsType.INS_TRIG_FUNC_SINH: (parse_function, "FUNCTION_CALL"),  # 143
+    InsType.INS_TRIG_FUNC_TANH: (parse_function, "FUNCTION_CALL"),  # 147
+    InsType.INS_QUERY_DATA_SOURCE: (parse_data_source, "QUERY_DATA_SOURCE"),  # 200
+    InsType.INS_RANK_CATEGORY_INSTANCE: (parse_rank_flag, "RANK_FLAG"),  # 94
+    InsType.INS_RANK_CATEGORY_AVAILABLE: (parse_rank_flag, "RANK_ACROSS_CATEGORY_ALL_AVAILABLE_ALT"),  # 93
+    InsType.DEF_INS_TYPE_SET_UNDERWRITING_TO_FAIL: (parse_empty, "SET_UNDERWRITING_TO_FAIL"),  # 254
+    InsType.INS_IS_DATE: (parse_type_check, "IS_DATE"),  # 95
+    InsType.INS_IS_NUMERIC: (parse_type_check, "IS_NUMERIC"),  # 98
+    InsType.INS_IS_ALPHA: (parse_type_check, "IS_ALPHA"),  # 99
+    # ...continue for all needed types...
+}
+
+
+def _build_dispatch(
+    parsers: dict[InsType, tuple[Callable[..., list[ASTNode]], str]],
+) -> tuple[tuple[Callable[..., list[ASTNode]], str], ...]:
+    """Flatten the parser map into a tuple indexed by ``ins_type.value + 1`` (UNKNOWN = -1 is slot 0).
+    Gaps point at _parse_unknown, so parse() needs a single indexed load and no branch per instruction.
+    """
+    by_value = {ins_type.value: entry for ins_type, entry in parsers.items()}
+    return tuple(
+        by_value.get(value, (_parse_unknown, "")) for value in range(-1, max(t.value for t in InsType) + 1)
+    )
+
+
+_DISPATCH = _build_dispatch(_PARSERS)
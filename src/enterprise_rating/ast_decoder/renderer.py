@@ -1,131 +1,231 @@
+import re
+import sys
+from collections.abc import Iterator, Mapping
+from functools import cache, lru_cache
 from pathlib import Path
 
 import yaml
-from jinja2 import Template
-
-from enterprise_rating.ast_decoder.ast_nodes import (ArithmeticNode,
-                                                     AssignmentNode,
-                                                     FunctionNode, IfNode,
-                                                     JumpNode)
-
-# Load once at module import
-with open(Path(__file__).parent / "templates.yml", encoding="utf-8") as f:
-   _cfg = yaml.safe_load(f)
-
-# Load and compile all templates at import time
-# _cfg = yaml.safe_load(Path(__file__).parent / "templates.yml")
-TEMPLATES = {
-    tpl_id: Template(tpl_text)
-    for tpl_id, tpl_text in _cfg["templates"].items()
-}
-STEP_TYPES = _cfg["step_types"]
+from jinja2 import DictLoader, Environment, Template
+
+from enterprise_rating.ast_decoder.ast_nodes import (
+    ArithmeticNode,
+    AssignmentNode,
+    ASTNode,
+    FunctionNode,
+    IfNode,
+    JumpNode,
+    RawNode,
+)
+
+_YML_PATH = Path(__file__).parent / "templates.yml"
+
+
+@cache
+def _load_cfg() -> dict:
+    """Parse templates.yml once per process."""
+    with open(_YML_PATH, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+_PLAIN_FIELD = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class _PlainTemplate:
+    """Stand-in for jinja2.Template when a snippet is only literal text and bare {{ name }} fields.
+    The text is split once here; render() interleaves str(value) with the literal pieces, matching
+    Jinja's defaults (missing names render as "", one trailing newline is dropped).
+    """
+
+    __slots__ = ("_head", "_pairs")
+
+    def __init__(self, text: str) -> None:
+        if text.endswith("\n"):
+            text = text[:-1]
+        pieces = _PLAIN_FIELD.split(text)
+        self._head = pieces[0]
+        self._pairs = tuple(zip(pieces[1::2], pieces[2::2], strict=True))
+
+    def render(self, **ctx: object) -> str:
+        out = [self._head]
+        append = out.append
+        for name, literal in self._pairs:
+            append(str(ctx.get(name, "")))
+            append(literal)
+        return "".join(out)
+
 
+def _compile(tpl_id: str, text: str, env: Environment) -> "_PlainTemplate | Template":
+    """Compile one snippet: plain substitutions skip the Jinja runtime, anything with
+    tags, comments, filters or expressions is loaded by id from the shared Environment.
+    """
+    rest = _PLAIN_FIELD.sub("", text)
+    if "{{" in rest or "{%" in rest or "{#" in rest:
+        return env.get_template(tpl_id)
+    return _PlainTemplate(text)
+
+
+class _LazyTemplates(Mapping):
+    """template id -> compiled template over every id in templates.yml. Each snippet compiles on
+    its first lookup and is kept, so a run only pays for the ones it renders; membership, len()
+    and iteration answer from the ids without compiling anything.
+    """
+
+    def __init__(self, texts: dict[str, str], env: Environment) -> None:
+        self._texts = texts
+        self._env = env
+        self._compiled: dict[str, _PlainTemplate | Template] = {}
+
+    def __getitem__(self, tpl_id: str) -> "_PlainTemplate | Template":
+        try:
+            return self._compiled[tpl_id]
+        except KeyError:
+            tpl = self._compiled[tpl_id] = _compile(tpl_id, self._texts[tpl_id], self._env)
+            return tpl
+
+    def __contains__(self, tpl_id: object) -> bool:
+        return tpl_id in self._texts
 
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._texts)
 
-def render_node_old(node):
-    """Turn a single AST node into a polished English sentence,
-    prefixed with the human-readable step-type label.
+    def __len__(self) -> int:
+        return len(self._texts)
+
+
+@cache
+def _templates() -> _LazyTemplates:
+    """TEMPLATES: templates.yml loaded on first use, so importing this module (every parser
+    import does) costs no file IO; each template compiles on its first lookup.
     """
-    # 1) look up the step-type
-    step_label = STEP_TYPES.get(str(node.ins_type), f"Type {node.ins_type}")
-
-    # 2) pick the right AST template
-    tpl = TEMPLATES.get(node.template_id, "{english}")
-
-    # 3) fill in fields common to all node shapes
-    filled = tpl.format(
-        left=getattr(node.condition.left, "raw", ""),
-        op=getattr(node.condition, "operator", ""),
-        right=getattr(node.condition.right, "raw", ""),
-        cond_op=node.condition.cond_op if hasattr(node.condition, "cond_op") else "",
-        args=", ".join(arg.raw for arg in getattr(node, "args", [])),
-        target=getattr(node, "target", ""),
-        english=getattr(node, "english", ""),
+    cfg = _load_cfg()
+    # Parser template ids are interned literals; interning the YAML keys too lets every
+    # template lookup match on identity instead of comparing the strings
+    texts = {sys.intern(tpl_id): text for tpl_id, text in cfg["templates"].items()}
+    # One Environment for every Jinja snippet (same defaults as a bare Template)
+    env = Environment(loader=DictLoader(texts), auto_reload=False)
+    return _LazyTemplates(texts, env)
+
+
+def __getattr__(name: str) -> _LazyTemplates:
+    """TEMPLATES stays readable as a module attribute; it resolves via _templates()."""
+    if name == "TEMPLATES":
+        return _templates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Rendered text depends only on the template and a handful of primitive fields, and the same
+# compare / arithmetic / jump shapes recur across thousands of steps, so each node shape renders
+# through an lru_cache keyed on exactly those fields. Exceptions propagate (and are not cached).
+@lru_cache(maxsize=4096)
+def _render_jump(tpl_id: str, target: int | None) -> str:
+    return _templates()[tpl_id].render(target=target).strip()
+
+
+@lru_cache(maxsize=4096)
+def _render_if(
+    tpl_id: str, clauses: tuple, joiner: str, true_target: int | None, false_target: int | None
+) -> str:
+    return _templates()[tpl_id].render(
+        conditions=[{"left": left, "op": op, "right": right} for left, op, right in clauses],
+        joiner=joiner,
+        true_target=true_target,
+        false_target=false_target,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_arithmetic(tpl_id: str, left: str, operator: str, right: str, round_spec: str) -> str:
+    return _templates()[tpl_id].render(left=left, operator=operator, right=right, round_spec=round_spec)
+
+
+@lru_cache(maxsize=4096)
+def _render_function(tpl_id: str, name: str, args: str, round_spec: str) -> str:
+    return _templates()[tpl_id].render(name=name, args=args, round_spec=round_spec)
+
+
+@lru_cache(maxsize=4096)
+def _render_assignment(tpl_id: str, args: str, next_true: str, next_false: str) -> str:
+    return _templates()[tpl_id].render(
+        name="Arithmetic", args=args, round_spec="", next_true=next_true, next_false=next_false
+    )
+
+
+# Per-node-type field extraction; render_node picks one with a single dict lookup on type(node).
+# The node classes have no subclasses, so exact-type keys match what isinstance did.
+def _node_jump(node: JumpNode, tpl_id: str) -> str:
+    # only {{ target }}
+    return _render_jump(tpl_id, node.target)
+
+
+def _node_if(node: IfNode, tpl_id: str) -> str:
+    # ANY IfNode, whether single‐ or multi‐clause: grab either the multi‐list or fall back to single
+    cond = node.condition
+    if cond is not None and hasattr(cond, "conditions"):
+        clauses = cond.conditions
+    else:
+        clauses = [cond] if cond is not None else []
+
+    return _render_if(
+        tpl_id,
+        tuple((c.left.value, c.operator, c.right.value) for c in clauses),
+        getattr(cond, "joiner", ""),
+        (
+            node.true_branch[0].target
+            if node.true_branch and isinstance(node.true_branch[0], JumpNode)
+            else None
+        ),
+        (
+            node.false_branch[0].target
+            if node.false_branch and isinstance(node.false_branch[0], JumpNode)
+            else None
+        ),
     )
 
-    return f"**{step_label}**: {filled}"
 
+def _node_arithmetic(node: ArithmeticNode, tpl_id: str) -> str:
+    # {{ left }}, {{ operator }}, {{ right }}, {{ round_spec }}
+    return _render_arithmetic(tpl_id, node.left.raw, node.operator, node.right.raw, node.round_spec or "")
 
-def render_node(node) -> str:
+
+def _node_function(node: FunctionNode, tpl_id: str) -> str:
+    # {{ name }}, {{ args }}, {{ round_spec }}
+    return _render_function(tpl_id, node.name, ", ".join(arg.raw for arg in node.args), node.round_spec or "")
+
+
+def _node_assignment(node: AssignmentNode, tpl_id: str) -> str:
+    # {{ args }} of the expression plus the next_true / next_false jump targets
+    return _render_assignment(
+        tpl_id,
+        ", ".join(arg.value for arg in node.expr.args),
+        str(node.next_true and node.next_true[0].target),
+        str(node.next_false and node.next_false[0].target),
+    )
+
+
+_HANDLERS = {
+    JumpNode: _node_jump,
+    IfNode: _node_if,
+    ArithmeticNode: _node_arithmetic,
+    FunctionNode: _node_function,
+    AssignmentNode: _node_assignment,
+}
+
+
+def render_node(node: ASTNode) -> str:
     """Render any ASTNode according to its template_id.
-    Special-case nodes without a `condition` (like JumpNode).
+    Node types without a handler fall back to whatever .english they carry (every ASTNode has one).
     If anything goes wrong, capture the exception text as node.english.
     """
     try:
-        tpl: Template | None = TEMPLATES.get(node.template_id)
+        tpl_id = node.template_id
         # if no template, fall back to pre-set .english
-        if tpl is None:
-            return getattr(node, "english", f"No Template found: {node.template_id}") or "What?"
-
-        # 1) JumpNode: only {{ target }}
-        if isinstance(node, JumpNode):
-            return tpl.render(target=node.target).strip()
-
-        # ANY IfNode, whether single‐ or multi‐clause:
-        if isinstance(node, IfNode):
-            # grab either the multi‐list or fall back to single
-            cond = node.condition
-            if cond is not None and hasattr(cond, "conditions"):
-                clauses = cond.conditions
-            else:
-                clauses = [cond] if cond is not None else []
-
-            return tpl.render(
-                conditions=[
-                    {
-                        "left":  c.left.value,
-                        "op":    c.operator,
-                        "right": c.right.value,
-                    }
-                    for c in clauses
-                ],
-                joiner=getattr(cond, "joiner", ""),
-                true_target=(
-                    node.true_branch[0].target
-                    if node.true_branch and isinstance(node.true_branch[0], JumpNode)
-                    else None
-                ),
-                false_target=(
-                    node.false_branch[0].target
-                    if node.false_branch and isinstance(node.false_branch[0], JumpNode)
-                    else None
-                )
-            )
-
-
-        # 3) ArithmeticNode: {{ left }}, {{ operator }}, {{ right }}, {{ round_spec }}
-        if isinstance(node, ArithmeticNode):
-            ctx = {
-                "left":       node.left.raw,
-                "operator":   node.operator,
-                "right":      node.right.raw,
-                "round_spec": node.round_spec or "",
-            }
-            return tpl.render(**ctx)
-
-        # 4) FunctionNode: {{ name }}, {{ args }}, {{ round_spec }}
-        if isinstance(node, FunctionNode):
-            ctx = {
-                "name":       node.name,
-                "args":       ", ".join(arg.raw for arg in node.args),
-                "round_spec": getattr(node, "round_spec", "") or "",
-            }
-            return tpl.render(**ctx)
-
-        if isinstance(node, AssignmentNode):
-            # 4a) AssignmentNode: {{ var }}, {{ expr }}, {{ target }}
-            ctx = {
-                "name":       "Arithmetic",
-                "args":       ", ".join(arg.value for arg in node.expr.args),
-                "round_spec": getattr(node, "round_spec", "") or "",
-                "next_true" : str(node.next_true and node.next_true[0].target),
-                "next_false": str(node.next_false and node.next_false[0].target),
-            }
-            return tpl.render(**ctx)
-
-
-        # 5) Fallback to any .english on the node
-        return getattr(node, "english", "") or ""
+        if tpl_id not in _templates():
+            return node.english or "What?"
+
+        handler = _HANDLERS.get(type(node))
+        if handler is None:
+            return node.english or ""
+        return handler(node, tpl_id)
 
     except Exception as e:
         # On error, store and return the exception text
@@ -134,30 +234,40 @@ def render_node(node) -> str:
         return err
 
 
+def render_nodes(nodes: list[ASTNode]) -> list[str]:
+    """render_node over a list, returned in input order. Nodes are bucketed by
+    (type, template_id) so the template check and handler lookup run once per bucket
+    instead of once per node; per-node results and error handling match render_node.
+    """
+    buckets: dict[tuple, list[int]] = {}
+    for i, node in enumerate(nodes):
+        buckets.setdefault((type(node), node.template_id), []).append(i)
 
-def render_node_new(node):
-    tpl = TEMPLATES.get(node.template_id)
-    if tpl:
-        if isinstance(node, JumpNode):
-            return tpl.format(target=node.target)
-        if isinstance(node, IfNode):
-            return tpl.format(
-                left=node.condition.left.raw,
-                op=node.condition.operator,
-                right=node.condition.right.raw
-            )
-        if isinstance(node, ArithmeticNode):
-            # fill in rounding if present:
-            round_fmt = ""
-            if getattr(node, "round_spec", None):
-                round_fmt = f" (round to {node.round_spec} places)"
-            # choose template or fallback
-            if tpl:
-                text = tpl.format(
-                    left=node.left.raw,
-                    operator=node.operator,
-                    right=node.right.raw,
-                    rounding=round_fmt
-                )
-    # fall back to node.english if someone pre-populated it
-    return node.english or ""
+    templates = _templates()
+    out = [""] * len(nodes)
+    for (node_type, tpl_id), indices in buckets.items():
+        handler = _HANDLERS.get(node_type) if tpl_id in templates else None
+        if handler is None:
+            # no template or no handler: keep render_node's fallbacks
+            for i in indices:
+                out[i] = render_node(nodes[i])
+            continue
+        for i in indices:
+            node = nodes[i]
+            try:
+                out[i] = handler(node, tpl_id)
+            except Exception as e:
+                out[i] = node.english = str(e)
+    return out
+
+
+def finalize(nodes: list[ASTNode]) -> list[ASTNode]:
+    """Render .english once for each root node, after the parser has finished wiring it
+    (branches, next_true / next_false). RawNode roots only echo the instruction and are left
+    as they are; every other root goes through render_node, so a missing template still
+    yields "What?".
+    """
+    todo = [node for node in nodes if type(node) is not RawNode]
+    for node, english in zip(todo, render_nodes(todo), strict=True):
+        node.english = english
+    return nodes
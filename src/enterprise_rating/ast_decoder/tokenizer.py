@@ -2,6 +2,7 @@
 # flake8: noqa: F401
 
 import re
+import sys
 from collections.abc import Callable
 from typing import NamedTuple
 
@@ -10,39 +11,55 @@ from enterprise_rating.ast_decoder.helpers.var_lookup import get_var_desc
 
 from .defs import InsType
 
+# Token type tags (interned; consumers compare them with ``==``, which short-circuits on identity)
+TOK_OP = sys.intern("OP")
+TOK_WORD = sys.intern("WORD")
+TOK_TARGET = sys.intern("TARGET")
+TOK_VAR = sys.intern("VAR")
+TOK_ROUND = sys.intern("ROUND")
+
+
+# Delimiters tokenize_all splits on (captured, so they come back as OP tokens)
+_TOKEN_RE = re.compile(r"(\||\^|\+|>=|<=|=|>|<|!R2|!RN|!RS|!|~|\{|\}|\[|\])")
+_OPS = frozenset(('|', '^', '+', '>=', '<=', '=', '>', '<', '!R2', '!RN', '!RS', '!', '~', '{', '}', '[', ']'))
+_JOINER_RE = re.compile(r'[\^+]')
+
 
 class Token(NamedTuple):
     type: str
     value: str
     description: str | None = None
 
-def tokenize_default(raw: str) -> list[str]:
-    return [raw] if raw else []
+# The splitting tokenizers below only cut raw on their delimiter; every piece comes back as a
+# WORD token, so the parsers read .type / .value whichever tokenizer served the instruction.
+def tokenize_default(raw: str) -> list[Token]:
+    return [Token(TOK_WORD, raw)] if raw else []
 
 
-def tokenize_pipe(raw: str) -> list[str]:
-    return raw.split('|') if raw else []
+def tokenize_pipe(raw: str) -> list[Token]:
+    return [Token(TOK_WORD, part) for part in raw.split('|')] if raw else []
 
 
-def tokenize_plus(raw: str) -> list[str]:
-    return raw.split('+') if raw else []
+def tokenize_plus(raw: str) -> list[Token]:
+    return [Token(TOK_WORD, part) for part in raw.split('+')] if raw else []
 
 
-def tokenize_pipe_first(raw: str) -> list[str]:
+def tokenize_pipe_first(raw: str) -> list[Token]:
     if not raw:
         return []
     idx = raw.find('|')
-    return [raw] if idx < 0 else [raw[:idx], raw[idx+1:]]
+    parts = [raw] if idx < 0 else [raw[:idx], raw[idx+1:]]
+    return [Token(TOK_WORD, part) for part in parts]
 
 
-def tokenize_tilde_pipe(raw: str) -> list[str]:
+def tokenize_tilde_pipe(raw: str) -> list[Token]:
     if not raw:
         return []
     core = raw.split('~', 1)[1] if '~' in raw else raw
-    return core.split('|')
+    return [Token(TOK_WORD, part) for part in core.split('|')]
 
 
-def tokenize_rank_usage_set(raw: str) -> list[str]:
+def tokenize_rank_usage_set(raw: str) -> list[Token]:
     if not raw:
         return []
     if '~' in raw:
@@ -50,12 +67,12 @@ def tokenize_rank_usage_set(raw: str) -> list[str]:
     else:
         idx = raw.find('|')
         core = raw[idx+1:] if idx >= 0 else ''
-    return core.split('|')
+    return [Token(TOK_WORD, part) for part in core.split('|')]
 
 def tokenize_multi_if(raw: str) -> list[str]:
     if not raw:
         return []
-    m = re.search(r'[\^+]', raw)
+    m = _JOINER_RE.search(raw)
     base_raw = raw[:m.start()] if m else raw
     tail = raw[m.start():] if m else ''
     base = base_raw.split('~', 1)[1] if '~' in base_raw else base_raw
@@ -75,6 +92,11 @@ def tokenize_multi_if(raw: str) -> list[str]:
         i = j
     return segments
 
+# Operator tokens are fixed (get_var_desc of a bare operator needs no context) and immutable,
+# so one prebuilt Token per operator is shared by every tokenize_all call
+_OP_TOKENS: dict[str, Token] = {op: Token(TOK_OP, get_var_desc(op)) for op in _OPS}
+
+
 def tokenize_all(raw: str) -> list[Token]:
     """Break raw instruction string into tokens: operators, vars, literals.
     Operators: | ^ + = > < ! ~ { } [ ]
@@ -82,23 +104,21 @@ def tokenize_all(raw: str) -> list[Token]:
     """
     if not raw:
         return []
-    # Regex to capture delimiters and words
-    pattern = r"(\||\^|\+|>=|<=|=|>|<|!R2|!RN|!RS|!|~|\{|\}|\[|\])"
-    parts = [p for p in re.split(pattern, raw) if p and not p.isspace()]
     tokens = []
-    for part in parts:
-        if part in {'|','^','+','>=','<=','=','>','<','!R2','!RN','!RS','!','~','{','}','[',']'}:
-            tokens.append(Token(type='OP', value=get_var_desc(part)))
-        else:
-            tokens.append(Token(type='WORD', value=part))
+    append = tokens.append
+    for part in _TOKEN_RE.split(raw):
+        if not part or part.isspace():
+            continue
+        op_token = _OP_TOKENS.get(part)
+        append(op_token if op_token is not None else Token(TOK_WORD, part))
     return tokens
 
 def tokenize_scan(raw: str, ins_type: InsType, ins_target: str | None) -> list[Token]:
     tokens = []
 
     if ins_target is not None:
-        tokens.append(Token(type='TARGET', value=ins_target))
-        tokens.append(Token(type='OP', value="=", description="[equals]"))
+        tokens.append(Token(type=TOK_TARGET, value=ins_target))
+        tokens.append(Token(type=TOK_OP, value="=", description="[equals]"))
 
     ptr = 0
     while ptr < len(raw):
@@ -108,7 +128,7 @@ def tokenize_scan(raw: str, ins_type: InsType, ins_target: str | None) -> list[T
 
         ptr = pr.next_ptr
 
-        tokens.append(Token(type='VAR', value=pr.variable))
+        tokens.append(Token(type=TOK_VAR, value=pr.variable))
 
         if len(pr.round_var_token) > 0 or pr.round_var != "NR":
             round_token = pr.round_var_token
@@ -125,10 +145,10 @@ def tokenize_scan(raw: str, ins_type: InsType, ins_target: str | None) -> list[T
                 case _:
                     round_desc = f"Round {pr.round_var}"
 
-            tokens.append(Token(type='ROUND', value=round_token, description=round_desc))
+            tokens.append(Token(type=TOK_ROUND, value=round_token, description=round_desc))
 
         if pr.next_op_phrase is not None and pr.next_op_symbol != '!':
-            tokens.append(Token(type='OP', value=pr.next_op_symbol, description=pr.next_op_phrase))
+            tokens.append(Token(type=TOK_OP, value=pr.next_op_symbol, description=pr.next_op_phrase))
 
     return tokens
 # -----------------------------------------------------------------------------
@@ -217,7 +237,7 @@ dispatch_map: dict[InsType, tuple[Callable, str]] = {
 def tokenize(raw_ins: str, ins_type: InsType, ins_target: str | None) -> list[Token]:
     """Tokenize the raw instruction string based on its type.
 
-    Returns a list of string segments according to the dispatch_map rules.
+    Returns a list of Tokens according to the dispatch_map rules.
     """
     func_tuple = dispatch_map.get(ins_type, (tokenize_default, "DEFAULT")) if ins_type is not None else None
 
@@ -231,4 +251,4 @@ def tokenize(raw_ins: str, ins_type: InsType, ins_target: str | None) -> list[To
 
     return []
 
-__all__ = ['InsType', 'tokenize', 'dispatch_map']
+__all__ = ['InsType', 'tokenize', 'dispatch_map', 'TOK_OP', 'TOK_WORD', 'TOK_TARGET', 'TOK_VAR', 'TOK_ROUND']
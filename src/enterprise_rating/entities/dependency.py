@@ -6,6 +6,16 @@ from pydantic import BaseModel, Field
 
 from enterprise_rating.entities.instruction import Instruction
 
+# Valid ib_type values per subclass; each Literal is the subclass's ib_type annotation, and the
+# frozensets back the is_*_variable checks that run inside get_var_desc's scans over every dependency.
+_CalculatedIbType = Literal["10", "3"]
+_TableIbType = Literal["6", "9"]
+_ResultIbType = Literal["8", "16"]
+
+_CALCULATED_IB_TYPES = frozenset(get_args(_CalculatedIbType))
+_TABLE_IB_TYPES = frozenset(get_args(_TableIbType))
+_RESULT_IB_TYPES = frozenset(get_args(_ResultIbType))
+
 
 class DependencyBase(BaseModel):
 
@@ -30,25 +40,19 @@ class DependencyBase(BaseModel):
 
     def is_calculated_variable(self) -> bool:
         """Check if this dependency is a CalculatedVariable based on its ib_type."""
-        # Get all valid ib_type values for CalculatedVariable
-        valid_types = get_args(CalculatedVariable.model_fields['ib_type'].annotation)
-        return getattr(self, "ib_type", None) in valid_types
+        return getattr(self, "ib_type", None) in _CALCULATED_IB_TYPES
 
     def is_result_variable(self) -> bool:
         """Check if this dependency is a ResultVariable based on its ib_type."""
-        # Get all valid ib_type values for CalculatedVariable
-        valid_types = get_args(ResultVariable.model_fields['ib_type'].annotation)
-        return getattr(self, "ib_type", None) in valid_types
+        return getattr(self, "ib_type", None) in _RESULT_IB_TYPES
 
     def is_table_variable(self) -> bool:
         """Check if this dependency is a TableVariable based on its ib_type."""
-        # Get all valid ib_type values for CalculatedVariable
-        valid_types = get_args(TableVariable.model_fields['ib_type'].annotation)
-        return getattr(self, "ib_type", None) in valid_types
+        return getattr(self, "ib_type", None) in _TABLE_IB_TYPES
 
 
 class CalculatedVariable(DependencyBase):
-    ib_type: Literal["10", "3"]
+    ib_type: _CalculatedIbType
     prog_key: str  # Primary key for the program
     revision_key: str  # Revision key for the algorithm
     program_id: str  # Program ID associated with the algorithm
@@ -57,7 +61,7 @@ class CalculatedVariable(DependencyBase):
 
 
 class TableVariable(DependencyBase):
-    ib_type: Literal["6", "9"]
+    ib_type: _TableIbType
     prog_key: str  # Primary key for the program
     revision_key: str  # Revision key for the algorithm
     program_id: str  # Program ID associated with the algorithm
@@ -66,7 +70,7 @@ class TableVariable(DependencyBase):
 
 
 class ResultVariable(DependencyBase):
-    ib_type: Literal["8", "16"]
+    ib_type: _ResultIbType
 
 
 class InputVariable(DependencyBase):
@@ -34,4 +34,5 @@ class ProgramVersion(BaseModel):
     group_symbol: str
     data_dictionary: DataDictionary
     algorithm_seq: list[AlgorithmSequence]
-    model_config = ConfigDict(from_attributes=True)
+    # get_program_version hands the same cached instance to every caller
+    model_config = ConfigDict(from_attributes=True, frozen=True)
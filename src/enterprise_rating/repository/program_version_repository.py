@@ -1,6 +1,7 @@
 import logging
 import os
-from dataclasses import asdict
+from collections import deque
+from dataclasses import asdict, fields
 from pathlib import Path
 
 import xmltodict
@@ -14,6 +15,7 @@ from enterprise_rating.ast_decoder.ast_nodes import (
     RawNode,
 )
 from enterprise_rating.ast_decoder.decoder import decode_ins  # noqa: F401
+from enterprise_rating.ast_decoder.helpers.var_lookup import desc_cache_scope
 from enterprise_rating.entities.dependency import CalculatedVariable, DependencyBase
 from enterprise_rating.entities.program_version import ProgramVersion  # wherever you defined your Pydantic models
 
@@ -22,6 +24,8 @@ logger = logging.getLogger(__name__)
 
 class ProgramVersionRepository:  # noqa: D101
     _NO_ARG = object()
+    # (XML path, mtime it was parsed at, decoded ProgramVersion) from the last load
+    _cache: tuple[Path, float, ProgramVersion | None] | None = None
 
     env_xml = os.environ.get("PROGRAM_VERSION_XML")
     if env_xml is None:
@@ -125,106 +129,93 @@ class ProgramVersionRepository:  # noqa: D101
         # Add more entities and their attribute maps as needed
     }
 
+    # Parent element tag -> attribute map for its children, so the postprocessor resolves the
+    # entity with one dict lookup instead of a chain of string compares
+    _PARENT_TO_MAP = {
+        "export": ATTRIBUTE_MAPS["ProgramVersion"],
+        "schema": ATTRIBUTE_MAPS["DataDictionary"],
+        "categories": ATTRIBUTE_MAPS["Category"],
+        "inputs": ATTRIBUTE_MAPS["Input"],
+        "seq": ATTRIBUTE_MAPS["AlgorithmSequence"],
+        "item": ATTRIBUTE_MAPS["Algorithm"],
+        "d": ATTRIBUTE_MAPS["DependencyBase"],
+        "i": ATTRIBUTE_MAPS["Instruction"],
+    }
+    _EMPTY_MAP: dict[str, str] = {}
+
     @staticmethod
     def _entity_aware_postprocessor(path, key, value=_NO_ARG):
         # only process if there's something to process
+        maps = ProgramVersionRepository.ATTRIBUTE_MAPS
 
         # Unwrap {"item": {...}} at any level
-        if isinstance(value, dict) and set(value.keys()) == {"item"}:
+        if isinstance(value, dict) and len(value) == 1 and "item" in value:
             value = value["item"]
 
-        attr_map = {}
         # Determine the entity type based on the path
         if path and isinstance(path[-1], tuple):
-            parent = path[-1][0]
-            if parent == "export":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("ProgramVersion", {})
-            elif parent == "schema":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("DataDictionary", {})
-            elif parent == "categories":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("Category", {})
-            elif parent == "inputs":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("Input", {})
-            elif parent == "seq":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("AlgorithmSequence", {})
-            elif parent == "item":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("Algorithm", {})
-            elif parent == "d":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("DependencyBase", {})
-            elif parent == "i":
-                attr_map = ProgramVersionRepository.ATTRIBUTE_MAPS.get("Instruction", {})
-
-        mapped_key = attr_map.get(key, key)
+            attr_map = ProgramVersionRepository._PARENT_TO_MAP.get(path[-1][0], ProgramVersionRepository._EMPTY_MAP)
+            mapped_key = attr_map.get(key, key)
+        else:
+            mapped_key = key
 
         # Flatten categories and inputs, and map their children
         if mapped_key == "categories" and isinstance(value, dict) and "c" in value:
             value = value["c"]
             # Map each category dict's keys
+            cmap = maps["Category"].get
             if isinstance(value, list):
-                value = [
-                    {ProgramVersionRepository.ATTRIBUTE_MAPS["Category"].get(k, k): v for k, v in item.items()}
-                    for item in value
-                ]
+                value = [{cmap(k, k): v for k, v in item.items()} for item in value]
             elif isinstance(value, dict):
-                value = [{ProgramVersionRepository.ATTRIBUTE_MAPS["Category"].get(k, k): v for k, v in value.items()}]
+                value = [{cmap(k, k): v for k, v in value.items()}]
 
-        if mapped_key == "inputs" and isinstance(value, dict) and "iv" in value:
+        elif mapped_key == "inputs" and isinstance(value, dict) and "iv" in value:
             value = value["iv"]
             # Map each input dict's keys
+            imap = maps["Input"].get
             if isinstance(value, list):
-                value = [
-                    {ProgramVersionRepository.ATTRIBUTE_MAPS["Input"].get(k, k): v for k, v in item.items()}
-                    for item in value
-                ]
+                value = [{imap(k, k): v for k, v in item.items()} for item in value]
             elif isinstance(value, dict):
-                value = [{ProgramVersionRepository.ATTRIBUTE_MAPS["Input"].get(k, k): v for k, v in value.items()}]
+                value = [{imap(k, k): v for k, v in value.items()}]
 
         # Flatten algorithm_seq and map their children
-        if mapped_key == "algorithm" and isinstance(value, dict) and "item" in value:
+        elif mapped_key == "algorithm" and isinstance(value, dict) and "item" in value:
             value = value["item"]
-            # Map each category dict's keys
+            # Map each algorithm dict's keys
+            amap = maps["Algorithm"].get
             if isinstance(value, list):
-                value = [
-                    {ProgramVersionRepository.ATTRIBUTE_MAPS["Algorithm"].get(k, k): v for k, v in item.items()}
-                    for item in value
-                ]
+                value = [{amap(k, k): v for k, v in item.items()} for item in value]
             elif isinstance(value, dict):
-                value = [{ProgramVersionRepository.ATTRIBUTE_MAPS["Algorithm"].get(k, k): v for k, v in value.items()}]
+                value = [{amap(k, k): v for k, v in value.items()}]
 
-        # Flatten algorithm_seq and map their children
-        if mapped_key == "dependency_vars" and value is not ProgramVersionRepository._NO_ARG:
+        elif mapped_key == "dependency_vars" and value is not ProgramVersionRepository._NO_ARG:
+            dmap = maps["DependencyBase"].get
             if isinstance(value, dict):
                 # Single dependency
-                value = {ProgramVersionRepository.ATTRIBUTE_MAPS["DependencyBase"].get(k, k): v for k, v in value.items()}
+                value = {dmap(k, k): v for k, v in value.items()}
             elif isinstance(value, list):
                 # If only one, maybe unwrap
                 if len(value) == 1:
-                    value = {ProgramVersionRepository.ATTRIBUTE_MAPS["DependencyBase"].get(k, k): v for k, v in value[0].items()}
+                    value = {dmap(k, k): v for k, v in value[0].items()}
                 else:
                     # If more than one, keep as list
-                    value = [
-                        {ProgramVersionRepository.ATTRIBUTE_MAPS["DependencyBase"].get(k, k): v for k, v in item.items()}
-                        for item in value
-                    ]
+                    value = [{dmap(k, k): v for k, v in item.items()} for item in value]
 
             ProgramVersionRepository._current_dependencies = value  # <-- Store dependencies
 
-        # Flatten algorithm_seq and map their children
-        if mapped_key == "steps":
+        elif mapped_key == "steps":
             # value is already the steps list/dict
+            smap = maps["Instruction"].get
             if isinstance(value, dict):
-                # Single dependency
-                value = {ProgramVersionRepository.ATTRIBUTE_MAPS["Instruction"].get(k, k): v for k, v in value.items()}
+                # Single instruction
+                value = {smap(k, k): v for k, v in value.items()}
             elif isinstance(value, list):
                 # If only one, maybe unwrap
                 if len(value) == 1:
-                    value = {ProgramVersionRepository.ATTRIBUTE_MAPS["Instruction"].get(k, k): v for k, v in value[0].items()}
+                    value = {smap(k, k): v for k, v in value[0].items()}
                 else:
                     # If more than one, keep as list
-                    value = [
-                        {ProgramVersionRepository.ATTRIBUTE_MAPS["Instruction"].get(k, k): v for k, v in item.items()}
-                        for item in value
-                    ]
+                    value = [{smap(k, k): v for k, v in item.items()} for item in value]
 
             value["ast"] = None
 
@@ -233,7 +224,7 @@ class ProgramVersionRepository:  # noqa: D101
     @staticmethod
     def _node_to_dict(obj) -> dict | list | str | int | None:
         """Recursively convert an ASTNode (or list of ASTNode) into a plain python dict/list.
-        If obj is an ASTNode subclass, we convert its __dict__ but recurse on any nested ASTNode or list.
+        If obj is an ASTNode subclass, we convert its dataclass fields but recurse on any nested ASTNode or list.
         Otherwise, return obj as-is (e.g. str, int).
         """
         # 1) If it’s exactly None, return None
@@ -247,8 +238,8 @@ class ProgramVersionRepository:  # noqa: D101
         # 3) If it’s one of our ASTNode subclasses, convert it
         if isinstance(obj, (RawNode, CompareNode, IfNode, ArithmeticNode, FunctionNode, AssignmentNode)):
             result = {}
-            for key, val in obj.__dict__.items():
-                result[key] = ProgramVersionRepository._node_to_dict(val)
+            for f in fields(obj):
+                result[f.name] = ProgramVersionRepository._node_to_dict(getattr(obj, f.name))
             return result
 
         # 4) Otherwise (primitives: str, int, etc.), return raw
@@ -256,70 +247,100 @@ class ProgramVersionRepository:  # noqa: D101
 
     @staticmethod
     def process_all_instructions(progver: ProgramVersion):
-
-        # 1) Iterate over every AlgorithmSequence → every Algorithm
-        for alg_seq in progver.algorithm_seq:
-            algorithm = alg_seq.algorithm
-
-            # 1.a) Process steps that live directly on this Algorithm
-            # 1.b) Process every DependencyBase under this Algorithm (including nested CalculatedVariable chains)
-            dependency_vars = getattr(algorithm, "dependency_vars", []) or []
-
-            main_steps = getattr(algorithm, "steps", []) or []
-            for instr in main_steps:
-                # At this point, instr must be an Instruction model (not a dict).
-                # Its ast field was defined as: ast: list[Any]|None = None
-                if instr.ast is None:
-                    try:
-                        # Produce a plain dict to hand into decode_ins(...)
-                        raw_dict = instr.model_dump()
-                        nodes = decode_ins(raw_dict, dependency_vars, progver)
-                        # Store back as list of dicts (as your Instruction.ast is a list[Any])
-                        instr.ast = [asdict(n) for n in nodes] if nodes else []
-                        # instr.ast = [
-                        #    ProgramVersionRepository._node_to_dict(n) for n in nodes
-                        # ]
-                    except Exception as e:
-                        error_node = RawNode(
-                            step=int(raw_dict.get("n", 0)),
-                            ins_type=int(raw_dict.get("t", 0)) if raw_dict.get("t") is not None else None,
-                            raw="",
-                            value=f"Repository ERROR: {e}"
-                        )
-                        instr.ast = [ProgramVersionRepository._node_to_dict(error_node)]
-
-            queue: list[DependencyBase] = []
-            for dep in dependency_vars:
-                queue.append(dep)
-
-            while queue:
-                cur_dep = queue.pop(0)
-                dep_vars = getattr(cur_dep, "dependency_vars", []) or []
-
-                # Process this dependency’s own steps (each should be an Instruction model)
-                dep_steps = getattr(cur_dep, "steps", []) or []
-                for instr in dep_steps:
+        # Variable descriptions are memoized for this ProgramVersion only
+        with desc_cache_scope():
+            # 1) Iterate over every AlgorithmSequence → every Algorithm
+            for alg_seq in progver.algorithm_seq:
+                algorithm = alg_seq.algorithm
+
+                # 1.a) Process steps that live directly on this Algorithm
+                # 1.b) Process every DependencyBase under this Algorithm (including nested CalculatedVariable chains)
+                dependency_vars = getattr(algorithm, "dependency_vars", []) or []
+
+                main_steps = getattr(algorithm, "steps", []) or []
+                for instr in main_steps:
+                    # At this point, instr must be an Instruction model (not a dict).
+                    # Its ast field was defined as: ast: list[Any]|None = None
                     if instr.ast is None:
                         try:
+                            # Produce a plain dict to hand into decode_ins(...)
                             raw_dict = instr.model_dump()
-                            nodes = decode_ins(raw_dict, dep_vars, progver, cur_dep)
+                            nodes = decode_ins(raw_dict, dependency_vars, progver)
+                            # Store back as list of dicts (as your Instruction.ast is a list[Any])
                             instr.ast = [asdict(n) for n in nodes] if nodes else []
+                            # instr.ast = [
+                            #    ProgramVersionRepository._node_to_dict(n) for n in nodes
+                            # ]
+                        except Exception as e:
+                            error_node = RawNode(
+                                step=int(raw_dict.get("n", 0)),
+                                ins_type=int(raw_dict.get("t", 0)) if raw_dict.get("t") is not None else None,
+                                raw="",
+                                value=f"Repository ERROR: {e}"
+                            )
+                            instr.ast = [ProgramVersionRepository._node_to_dict(error_node)]
+
+                # Worklist over dependencies; a CalculatedVariable shared by several parents (or a cycle)
+                # is visited once
+                queue: deque[DependencyBase] = deque(dependency_vars)
+                seen: set[int] = set()
+
+                while queue:
+                    cur_dep = queue.popleft()
+                    if id(cur_dep) in seen:
+                        continue
+                    seen.add(id(cur_dep))
+                    dep_vars = getattr(cur_dep, "dependency_vars", []) or []
+
+                    # Process this dependency’s own steps (each should be an Instruction model)
+                    dep_steps = getattr(cur_dep, "steps", []) or []
+                    for instr in dep_steps:
+                        if instr.ast is None:
+                            try:
+                                raw_dict = instr.model_dump()
+                                nodes = decode_ins(raw_dict, dep_vars, progver, cur_dep)
+                                instr.ast = [asdict(n) for n in nodes] if nodes else []
+
+                            except Exception:
+                                instr.ast = []
+
+                    # If this dependency is a CalculatedVariable, enqueue its nested dependency_vars
+                    nested = getattr(cur_dep, "dependency_vars", []) or []
+                    for nd in nested:
+                        if isinstance(nd, CalculatedVariable) and id(nd) not in seen:
+                            queue.append(nd)
 
-                        except Exception:
-                            instr.ast = []
-
-                # If this dependency is a CalculatedVariable, enqueue its nested dependency_vars
-                nested = getattr(cur_dep, "dependency_vars", []) or []
-                for nd in nested:
-                    if isinstance(nd, CalculatedVariable):
-                        queue.append(nd)
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the cached ProgramVersion so the next get_program_version re-reads the XML."""
+        ProgramVersionRepository._cache = None
 
     @staticmethod
     def get_program_version(lob: str, progId: str, progVer: str) -> ProgramVersion | None:
-        with open(ProgramVersionRepository.XML_FILE, encoding="utf-8") as f:
+        """Parse, validate and decode the program version XML.
+
+        The XML is the single file named by PROGRAM_VERSION_XML; lob, progId and progVer do not
+        select anything yet. The decoded result is reused until the file's mtime changes, and
+        clear_cache() drops it. ProgramVersion is frozen, so callers cannot reassign its fields
+        on the shared instance.
+        """
+        path = ProgramVersionRepository.XML_FILE
+        mtime = path.stat().st_mtime
+        cached = ProgramVersionRepository._cache
+        if cached is None or cached[0] != path or cached[1] != mtime:
+            cached = (path, mtime, ProgramVersionRepository._load_program_version())
+            ProgramVersionRepository._cache = cached
+
+        return cached[2]
+
+    @staticmethod
+    def _load_program_version() -> ProgramVersion | None:
+        # Hand expat the open file so it reads the document in chunks rather than holding a full
+        # copy of the text alongside the dict tree; binary mode lets the XML declaration pick the encoding
+        with open(ProgramVersionRepository.XML_FILE, "rb") as f:
             doc = xmltodict.parse(
-                f.read(), postprocessor=ProgramVersionRepository._entity_aware_postprocessor, force_list=("seq", "dependency_vars", "steps", "i", "ast")
+                f, postprocessor=ProgramVersionRepository._entity_aware_postprocessor, force_list=("seq", "dependency_vars", "steps", "i", "ast")
             )
 
         progver_data = doc.get("export", {})
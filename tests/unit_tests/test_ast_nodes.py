@@ -0,0 +1,29 @@
+from dataclasses import asdict
+
+from enterprise_rating.ast_decoder.ast_nodes import IfNode
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.defs import InsType
+
+
+def test_empty_instruction_decodes_to_a_list():
+    for ins_type in (6, 254):  # EMPTY, SET_UNDERWRITING_TO_FAIL
+        ast = decode_ins({"n": 5, "t": ins_type, "ins": "", "ins_tar": "", "seq_t": -2, "seq_f": -2})
+
+        assert ast == []
+        assert type(ast) is list
+
+
+def test_if_node_branches_default_to_separate_lists():
+    first, second = IfNode(1, InsType.DEF_INS_TYPE_NUMERIC_IF), IfNode(2, InsType.DEF_INS_TYPE_NUMERIC_IF)
+
+    assert first.true_branch == first.false_branch == []
+    assert first.true_branch is not first.false_branch
+    assert first.true_branch is not second.true_branch
+
+
+def test_unwired_if_branches_serialize_as_lists():
+    data = asdict(IfNode(7, InsType.INS_IS_DATE))
+
+    assert data["true_branch"] == []
+    assert data["false_branch"] == []
+    assert type(data["true_branch"]) is list
@@ -0,0 +1,34 @@
+import pytest
+
+from enterprise_rating.ast_decoder.decoder import decode_algorithm, decode_batch, decode_ins
+from enterprise_rating.entities.dependency import ResultVariable
+
+RAW_INS = [
+    {"n": 1, "t": 1, "ins": "|~GR_5369|=|[Y]|", "ins_tar": "", "seq_t": 2, "seq_f": 4},
+    {"n": 2, "t": 95, "ins": "~GI_573|=|", "ins_tar": "", "seq_t": 3, "seq_f": 4},
+    {"n": 3, "t": 5, "ins": "GR_5369", "ins_tar": "", "seq_t": 4, "seq_f": 4},
+    {"n": 4, "t": 1, "ins": "|GR_5369|=|{A}|^|GI_2|>|{3}|", "ins_tar": "", "seq_t": 5, "seq_f": -2},
+    {"n": 5, "t": 6, "ins": "", "ins_tar": "", "seq_t": -2, "seq_f": -2},
+    {"n": 6, "t": 1, "ins": "|~GR_5369|=|[Y]|", "ins_tar": "", "seq_t": -2, "seq_f": -2},
+]
+
+
+def test_decode_batch_matches_decode_ins():
+    deps = [ResultVariable(ib_type="8", category_id="1", description="Policy Status", index=5369)]
+
+    batch = decode_batch(RAW_INS, deps)
+
+    # node equality covers the rendered .english as well as the structure
+    assert batch == [decode_ins(raw, deps) for raw in RAW_INS]
+
+
+def test_decode_algorithm_indexes_decode_ins_by_step():
+    nodes_by_step = decode_algorithm(RAW_INS)
+
+    assert list(nodes_by_step) == [raw["n"] for raw in RAW_INS]
+    assert nodes_by_step == {raw["n"]: decode_ins(raw) for raw in RAW_INS}
+
+
+def test_decode_algorithm_rejects_duplicate_steps():
+    with pytest.raises(ValueError, match="Duplicate step number 1"):
+        decode_algorithm([RAW_INS[0], RAW_INS[1], {**RAW_INS[2], "n": 1}])
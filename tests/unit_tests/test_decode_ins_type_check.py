@@ -0,0 +1,27 @@
+import pytest
+
+from enterprise_rating.ast_decoder.ast_nodes import IfNode, JumpNode, TypeCheckNode
+from enterprise_rating.ast_decoder.decoder import decode_ins
+
+
+@pytest.mark.parametrize(
+    ("ins_type", "check_type"),
+    [
+        (95, "date"),      # INS_IS_DATE
+        (98, "numeric"),   # INS_IS_NUMERIC
+        (99, "alpha"),     # INS_IS_ALPHA
+    ],
+)
+def test_decode_ins_type_check_label(ins_type: int, check_type: str):
+    raw_ins = {"n": 2, "t": ins_type, "ins": "~GI_573|=|", "ins_tar": "", "seq_t": 3, "seq_f": 4}
+
+    ast = decode_ins(raw_ins)
+
+    assert len(ast) == 1
+    node = ast[0]
+    assert isinstance(node, IfNode)
+    assert isinstance(node.condition, TypeCheckNode)
+    assert node.condition.check_type == check_type
+    assert node.condition.left.raw == "GI_573"
+    assert [j.target for j in node.true_branch if isinstance(j, JumpNode)] == [3]
+    assert [j.target for j in node.false_branch if isinstance(j, JumpNode)] == [4]
@@ -0,0 +1,26 @@
+from enterprise_rating.ast_decoder.ast_nodes import IfNode, MultiConditionNode
+from enterprise_rating.ast_decoder.decode_mif import decode_mif
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.helpers.raw_ins import RawIns
+from enterprise_rating.ast_decoder.renderer import render_node
+
+RAW_MIF = {"n": 4, "t": 1, "ins": "|GI_1|=|{A}|^|GI_2|>|{3}|", "ins_tar": "", "seq_t": 5, "seq_f": 7}
+
+
+def test_decode_mif_renders_its_own_english():
+    ast = decode_mif(RawIns.from_dict(RAW_MIF), template_id="IF_COMPARE")
+
+    assert len(ast) == 1
+    node = ast[0]
+    assert isinstance(node, IfNode)
+    assert isinstance(node.condition, MultiConditionNode)
+    assert node.condition.joiner == "OR"
+    assert [(c.left.raw, c.right.raw) for c in node.condition.conditions] == [("GI_1", "{A}"), ("GI_2", "{3}")]
+    assert node.english == render_node(node)
+    assert "IF *GI_1* **[equals]** *A* **OR**" in node.english
+    assert "then *[Step 5]*" in node.english
+    assert "else *[Step 7]*" in node.english
+
+
+def test_decode_ins_routes_multi_if_through_decode_mif():
+    assert decode_ins(RAW_MIF) == decode_mif(RawIns.from_dict(RAW_MIF), template_id="IF_COMPARE")
@@ -0,0 +1,76 @@
+import pytest
+
+from enterprise_rating.ast_decoder.ast_nodes import ArithmeticNode, FunctionNode
+from enterprise_rating.ast_decoder.defs import InsType
+from enterprise_rating.ast_decoder.helpers.raw_ins import RawIns
+from enterprise_rating.ast_decoder.parser import parse, parse_function
+from enterprise_rating.ast_decoder.tokenizer import TOK_OP, TOK_ROUND, TOK_WORD, Token
+
+# Hard-coded arithmetic instruction: GI_1 * GI_2, optionally rounded to 2 places
+RAW_INS = RawIns(n=3, t=0, ins="GI_1|*|GI_2", ins_tar="", seq_t=4, seq_f=-2)
+TOKENS = [Token(TOK_WORD, "GI_1"), Token(TOK_OP, "*"), Token(TOK_WORD, "GI_2")]
+
+
+def test_parse_arithmetic_without_round_suffix():
+    tokens = list(TOKENS)
+
+    ast = parse(tokens, RAW_INS)
+
+    assert tokens == TOKENS
+    assert len(ast) == 1
+    node = ast[0]
+    assert isinstance(node, ArithmeticNode)
+    assert (node.left.raw, node.operator, node.right.raw) == ("GI_1", "*", "GI_2")
+    assert node.round_spec is None
+
+
+def test_parse_arithmetic_with_round_suffix():
+    tokens = [*TOKENS, Token(TOK_WORD, "!R2")]
+
+    ast = parse(tokens, RAW_INS._replace(ins="GI_1|*|GI_2|!R2"))
+
+    # the suffix is sliced off, not popped from the caller's list
+    assert tokens == [*TOKENS, Token(TOK_WORD, "!R2")]
+    node = ast[0]
+    assert isinstance(node, ArithmeticNode)
+    assert (node.left.raw, node.operator, node.right.raw) == ("GI_1", "*", "GI_2")
+    assert node.round_spec == "R2"
+
+
+def test_parse_function_round_suffix_leaves_tokens_alone():
+    tokens = [Token(TOK_WORD, "GI_5"), Token(TOK_WORD, "!R2")]
+
+    node = parse_function(tokens, RAW_INS, 3, InsType.INS_MATH_FUNC_SQRT, "", template_id="FUNCTION_CALL")[0]
+
+    assert len(tokens) == 2
+    assert isinstance(node, FunctionNode)
+    assert [a.raw for a in node.args] == ["GI_5"]
+    assert node.round_spec == "R2"
+
+
+def test_parse_function_keeps_round_tokens_among_args():
+    tokens = [Token(TOK_WORD, "GI_5"), Token(TOK_ROUND, "RP2", "Round Up 2")]
+
+    node = parse_function(tokens, RAW_INS, 3, InsType.INS_MATH_FUNC_SQRT, "", template_id="FUNCTION_CALL")[0]
+
+    assert [a.raw for a in node.args] == ["GI_5", "RP2"]
+    assert node.round_spec is None
+
+
+@pytest.mark.parametrize(
+    ("ins_type", "name"),
+    [
+        (133, "Square Root"),          # INS_MATH_FUNC_SQRT
+        (128, "Natural Log"),          # INS_MATH_FUNC_LOG
+        (147, "Hyperbolic Tangent"),   # INS_TRIG_FUNC_TANH
+        (130, "Ins_Math_Func_Expe"),   # INS_MATH_FUNC_EXPE: no friendly name
+    ],
+)
+def test_parse_function_display_name(ins_type: int, name: str):
+    raw_ins = RawIns(n=3, t=ins_type, ins="GI_5", ins_tar="", seq_t=4, seq_f=-2)
+
+    node = parse([Token(TOK_WORD, "GI_5")], raw_ins)[0]
+
+    assert isinstance(node, FunctionNode)
+    assert node.name == name
+    assert node.ins_type == InsType(ins_type)
@@ -0,0 +1,26 @@
+import pytest
+
+from enterprise_rating.ast_decoder import parser
+from enterprise_rating.ast_decoder.ast_nodes import RawNode
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.defs import InsType
+from enterprise_rating.entities.program_version import ProgramVersion
+
+RAW_INS = {"n": 7, "t": InsType.INS_RANK_CATEGORY_INSTANCE.value, "ins": "|~GI_5|DGC_6|PL_1|", "seq_t": 8, "seq_f": 8}
+
+
+def test_rank_flag_describes_marked_gi_gc_cells(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(parser, "_desc", lambda var, *args: var if var.startswith("Ins ") else f"desc of {var}")
+
+    ast = decode_ins(RAW_INS, [], ProgramVersion.model_construct())
+
+    assert len(ast) == 1
+    node = ast[0]
+    assert isinstance(node, RawNode)
+    assert node.raw == "Ins Rank Category Instance: , desc of ~GI_5, desc of DGC_6, PL_1, "
+
+
+def test_rank_flag_without_lookups_echoes_the_cells():
+    node = decode_ins(RAW_INS)[0]
+
+    assert node.raw == node.value == "Ins Rank Category Instance: , ~GI_5, DGC_6, PL_1, "
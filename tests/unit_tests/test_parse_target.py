@@ -0,0 +1,37 @@
+import pytest
+
+from enterprise_rating.ast_decoder import parser
+from enterprise_rating.ast_decoder.decoder import decode_ins
+
+
+@pytest.fixture
+def target_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls = []
+
+    def record(target_var: str, dep: object = None) -> str:
+        calls.append(target_var)
+        return target_var
+
+    monkeypatch.setattr(parser, "get_target_var_desc", record)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "raw_ins",
+    [
+        {"n": 1, "t": 1, "ins": "|~GR_5369|=|[Y]|", "ins_tar": "PC_1060", "seq_t": 2, "seq_f": 4},
+        {"n": 2, "t": 95, "ins": "~GI_573|=|", "ins_tar": "PC_1060", "seq_t": 3, "seq_f": 4},
+        {"n": 3, "t": 56, "ins": "GI_1|>|GI_2", "ins_tar": "PC_1060", "seq_t": 4, "seq_f": 5},  # no parser
+    ],
+)
+def test_parsers_without_target_skip_target_lookup(raw_ins: dict, target_calls: list[str]):
+    decode_ins(raw_ins)
+
+    assert target_calls == []
+
+
+def test_assignment_resolves_target(target_calls: list[str]):
+    decode_ins({"n": 3, "t": 5, "ins": "GR_5369", "ins_tar": "PC_1060", "seq_t": 4, "seq_f": 4})
+    decode_ins({"n": 4, "t": 5, "ins": "GR_5369", "seq_t": 5, "seq_f": 5})
+
+    assert target_calls == ["PC_1060", ""]
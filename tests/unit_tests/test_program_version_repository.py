@@ -0,0 +1,207 @@
+import importlib
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.entities.algorithm import Algorithm, AlgorithmSequence
+from enterprise_rating.entities.dependency import CalculatedVariable
+from enterprise_rating.entities.instruction import Instruction
+from enterprise_rating.entities.program_version import ProgramVersion
+
+
+@pytest.fixture
+def repository(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[type, list[int]]:
+    xml_file = tmp_path / "program_version.xml"
+    xml_file.write_text("<export/>", encoding="utf-8")
+    # the class reads PROGRAM_VERSION_XML when the module is first imported
+    monkeypatch.setenv("PROGRAM_VERSION_XML", str(xml_file))
+    module = importlib.import_module("enterprise_rating.repository.program_version_repository")
+    repo = module.ProgramVersionRepository
+
+    loads = []
+
+    def load() -> ProgramVersion:
+        loads.append(1)
+        return ProgramVersion.model_construct(program_id=f"P{len(loads)}")
+
+    monkeypatch.setattr(repo, "XML_FILE", xml_file)
+    monkeypatch.setattr(repo, "_cache", None)
+    monkeypatch.setattr(repo, "_load_program_version", staticmethod(load))
+    return repo, loads
+
+
+def test_get_program_version_is_cached_until_mtime_changes(repository: tuple[type, list[int]]):
+    repo, loads = repository
+
+    first = repo.get_program_version("lob", "1", "1")
+    second = repo.get_program_version("other", "2", "2")
+    assert loads == [1]
+    assert first.program_id == second.program_id == "P1"
+
+    stat = repo.XML_FILE.stat()
+    os.utime(repo.XML_FILE, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert repo.get_program_version("lob", "1", "1").program_id == "P2"
+    assert loads == [1, 1]
+
+
+def test_get_program_version_hit_returns_the_cached_instance(
+    repository: tuple[type, list[int]], monkeypatch: pytest.MonkeyPatch
+):
+    repo, loads = repository
+    first = repo.get_program_version("lob", "1", "1")
+
+    def no_copy(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cache hit copied the ProgramVersion")
+
+    monkeypatch.setattr(ProgramVersion, "model_copy", no_copy)
+
+    assert repo.get_program_version("lob", "1", "1") is first
+    assert loads == [1]
+
+
+def test_get_program_version_reloads_when_the_xml_path_changes(
+    repository: tuple[type, list[int]], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    repo, loads = repository
+    first = repo.get_program_version("lob", "1", "1")
+
+    other = tmp_path / "other.xml"
+    other.write_text("<export/>", encoding="utf-8")
+    monkeypatch.setattr(repo, "XML_FILE", other)
+
+    assert repo.get_program_version("lob", "1", "1") is not first
+    assert loads == [1, 1]
+
+
+def test_cached_program_version_is_frozen(repository: tuple[type, list[int]]):
+    repo, _ = repository
+    program_version = repo.get_program_version("lob", "1", "1")
+
+    with pytest.raises(ValidationError):
+        program_version.program_id = "other"
+    assert repo.get_program_version("lob", "1", "1").program_id == "P1"
+
+
+def _instr(n: int) -> Instruction:
+    return Instruction(n=n, t=1, ins="|A|=|{B}|", seq_t=-2, seq_f=-2)
+
+
+def _calc(calc_index: int, steps: list[Instruction], deps: list | None = None) -> CalculatedVariable:
+    return CalculatedVariable.model_construct(
+        ib_type="10", category_id="c", description=f"Calc {calc_index}", index=calc_index,
+        calc_index=calc_index, steps=steps, dependency_vars=deps,
+    )
+
+
+@pytest.fixture
+def decode_calls(repository: tuple[type, list[int]], monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+    module = importlib.import_module("enterprise_rating.repository.program_version_repository")
+    calls = []
+
+    def record(raw_ins: dict, deps: list | None = None, progver: object = None, dep_item: object = None) -> list:
+        calls.append((raw_ins["n"], deps, dep_item))
+        return decode_ins(raw_ins, deps, progver, dep_item)
+
+    monkeypatch.setattr(module, "decode_ins", record)
+    return calls
+
+
+def _progver(algorithm_deps: list) -> ProgramVersion:
+    algorithm = Algorithm.model_construct(steps=[_instr(1)], dependency_vars=algorithm_deps)
+    return ProgramVersion.model_construct(algorithm_seq=[AlgorithmSequence.model_construct(algorithm=algorithm)])
+
+
+def test_shared_calculated_variable_is_decoded_once_with_its_own_deps(
+    repository: tuple[type, list[int]], decode_calls: list[tuple]
+):
+    repo, _ = repository
+    nested = _calc(4, [_instr(40)])
+    shared = _calc(3, [_instr(30)], [nested])
+    parent_a = _calc(1, [_instr(10)], [shared])
+    parent_b = _calc(2, [_instr(20)], [shared])
+
+    repo.process_all_instructions(_progver([parent_a, parent_b]))
+
+    # Same calls the per-parent walk made: its `instr.ast is None` guard skipped the shared
+    # variable's steps on every visit after the first, which used the variable's own deps
+    assert decode_calls == [
+        (1, [parent_a, parent_b], None),
+        (10, [shared], parent_a),
+        (20, [shared], parent_b),
+        (30, [nested], shared),
+        (40, [], nested),
+    ]
+    assert shared.steps[0].ast == [asdict(n) for n in decode_ins(_instr(30).model_dump(), [nested], None, shared)]
+
+
+def test_dependency_cycle_terminates(repository: tuple[type, list[int]], decode_calls: list[tuple]):
+    repo, _ = repository
+    first = _calc(1, [_instr(10)])
+    second = _calc(2, [_instr(20)], [first])
+    first.dependency_vars = [second]
+
+    repo.process_all_instructions(_progver([first]))
+
+    assert [n for n, _, _ in decode_calls] == [1, 10, 20]
+
+
+@pytest.mark.parametrize(
+    ("parent", "entity"),
+    [
+        ("export", "ProgramVersion"),
+        ("schema", "DataDictionary"),
+        ("categories", "Category"),
+        ("inputs", "Input"),
+        ("seq", "AlgorithmSequence"),
+        ("item", "Algorithm"),
+        ("d", "DependencyBase"),
+        ("i", "Instruction"),
+    ],
+)
+def test_postprocessor_maps_attributes_by_parent_element(
+    repository: tuple[type, list[int]], monkeypatch: pytest.MonkeyPatch, parent: str, entity: str
+):
+    repo, _ = repository
+    monkeypatch.setattr(repo, "_current_dependencies", None, raising=False)
+    attr_map = repo.ATTRIBUTE_MAPS[entity]
+
+    assert repo._PARENT_TO_MAP[parent] is attr_map
+    for key, mapped_key in attr_map.items():
+        assert repo._entity_aware_postprocessor([("export", None), (parent, None)], key, {})[0] == mapped_key
+    assert repo._entity_aware_postprocessor([(parent, None)], "@unmapped", "x") == ("@unmapped", "x")
+
+
+def test_postprocessor_leaves_keys_outside_a_mapped_parent(repository: tuple[type, list[int]]):
+    repo, _ = repository
+
+    assert repo._entity_aware_postprocessor([("other", None)], "@pk", "1") == ("@pk", "1")
+    assert repo._entity_aware_postprocessor(["item"], "@pk", "1") == ("@pk", "1")
+    assert repo._entity_aware_postprocessor([], "@pk", "1") == ("@pk", "1")
+
+
+def test_postprocessor_maps_dependency_and_step_children(
+    repository: tuple[type, list[int]], monkeypatch: pytest.MonkeyPatch
+):
+    repo, _ = repository
+    monkeypatch.setattr(repo, "_current_dependencies", None, raising=False)
+    path = [("item", None)]
+
+    key, deps = repo._entity_aware_postprocessor(path, "d", [{"@t": "8", "@d": "Premium"}, {"@t": "4", "@i": "2"}])
+    assert key == "dependency_vars"
+    assert deps == [{"ib_type": "8", "description": "Premium"}, {"ib_type": "4", "index": "2"}]
+    assert repo._current_dependencies is deps
+
+    key, steps = repo._entity_aware_postprocessor(path, "i", {"@n": "1", "@t": "1", "@ins": "|A|=|{B}|"})
+    assert key == "steps"
+    assert steps == {"n": "1", "t": "1", "ins": "|A|=|{B}|", "ast": None}
+
+    key, categories = repo._entity_aware_postprocessor(
+        [("export", None)], "categories", {"c": [{"@i": "1", "@d": "Auto"}]}
+    )
+    assert key == "categories"
+    assert categories == [{"index": "1", "description": "Auto"}]
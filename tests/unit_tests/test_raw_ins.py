@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+
+from enterprise_rating.ast_decoder.ast_nodes import AssignmentNode
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.defs import InsType
+from enterprise_rating.ast_decoder.helpers.raw_ins import RawIns, _maybe_int
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (7, 7),
+        ("7", 7),
+        ("-2", -2),
+        (" 3", 3),
+        ("+3", 3),
+        (True, 1),
+        (None, None),
+        ("", None),
+    ],
+)
+def test_maybe_int(value: object, expected: int | None):
+    result = _maybe_int(value)
+
+    assert result == expected
+    assert result is None or type(result) is int
+
+
+@pytest.mark.parametrize("value", ["3.0", "abc", [3]])
+def test_maybe_int_logs_rejected_values(value: object, caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.WARNING):
+        assert _maybe_int(value) is None
+
+    assert repr(value) in caplog.text
+
+
+def test_raw_ins_from_dict():
+    raw = RawIns.from_dict({"n": "3", "t": "x", "ins": None, "ins_tar": "PC_1", "seq_t": " 4", "seq_f": "-2"})
+
+    assert raw == RawIns(n=3, t=InsType.UNKNOWN.value, ins="", ins_tar="PC_1", seq_t=4, seq_f=-2)
+
+
+def test_raw_ins_from_dict_defaults_missing_target_to_empty():
+    assert RawIns.from_dict({"n": 4, "t": 5, "ins": "GR_5369"}).ins_tar == ""
+
+
+@pytest.mark.parametrize("ins_type", [2, 5, 86])  # CALL, SET_STRING, STR_CONCAT: tokenize_scan types
+def test_decode_ins_without_target_keeps_target_tokens(ins_type: int):
+    ast = decode_ins({"n": 4, "t": ins_type, "ins": "GR_5369"})
+
+    node = ast[0]
+    expr = node.expr if isinstance(node, AssignmentNode) else node
+    assert [arg.raw for arg in expr.args[:2]] == ["", "="]
@@ -0,0 +1,123 @@
+import pytest
+
+from enterprise_rating.ast_decoder import renderer
+from enterprise_rating.ast_decoder.ast_nodes import (
+    ArithmeticNode,
+    AssignmentNode,
+    ASTNode,
+    FunctionNode,
+    JumpNode,
+    RawNode,
+)
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.defs import InsType
+from enterprise_rating.ast_decoder.renderer import finalize, render_node, render_nodes
+
+_CACHED_RENDERERS = ("_render_jump", "_render_if", "_render_arithmetic", "_render_function", "_render_assignment")
+
+
+def _raw(value: str) -> RawNode:
+    return RawNode(1, InsType.DEF_INS_TYPE_ARITHEMETIC, value, value)
+
+
+def _sample_nodes() -> list[ASTNode]:
+    """One node per render handler, plus IFs decoded from hardcoded instructions."""
+    step_if = {"n": 1, "t": 1, "ins": "|~GR_5369|=|[Y]|", "ins_tar": "", "seq_t": 2, "seq_f": -2}
+    multi_if = {"n": 2, "t": 1, "ins": "|GI_1|=|{A}|+|GI_2|>|{3}|", "ins_tar": "", "seq_t": 3, "seq_f": 4}
+    assignment = AssignmentNode(
+        1, InsType.SET_STRING, "PC_1", FunctionNode(1, InsType.SET_STRING, "SetString", [_raw("GI_1")]),
+        template_id="ASSIGNMENT",
+        next_true=[JumpNode(1, InsType.SET_STRING, target=2)],
+        next_false=[JumpNode(1, InsType.SET_STRING, target=-2)],
+    )
+    return [
+        JumpNode(1, InsType.DEF_INS_TYPE_NUMERIC_IF, template_id="JUMP", target=7),
+        *decode_ins(step_if),
+        *decode_ins(multi_if),
+        ArithmeticNode(1, InsType.DEF_INS_TYPE_ARITHEMETIC, _raw("GI_1"), "*", _raw("GI_2"), "R2",
+                       template_id="ASSIGNMENT"),
+        FunctionNode(1, InsType.INS_MATH_FUNC_SQRT, "Square Root", [_raw("GI_5")], "R2", template_id="FUNCTION_CALL"),
+        FunctionNode(1, InsType.DATE_DIFF_DAYS, "DateDifference", [_raw("GI_1"), _raw("GI_2")],
+                     template_id="DATE_DIFF"),
+        assignment,
+    ]
+
+
+def test_cached_rendering_matches_uncached(monkeypatch: pytest.MonkeyPatch):
+    nodes = _sample_nodes()
+    cached = [render_node(node) for node in nodes]
+    # second pass is served from the lru_caches
+    assert [render_node(node) for node in nodes] == cached
+
+    for name in _CACHED_RENDERERS:
+        monkeypatch.setattr(renderer, name, getattr(renderer, name).__wrapped__)
+    assert [render_node(node) for node in _sample_nodes()] == cached
+    assert all(cached)
+
+
+def test_render_nodes_matches_render_node():
+    def nodes() -> list[ASTNode]:
+        return [
+            *_sample_nodes(),
+            # no template: "What?" / preset english fallbacks
+            FunctionNode(1, InsType.DEF_INS_TYPE_CALL, "CallOut", []),
+            FunctionNode(1, InsType.DEF_INS_TYPE_CALL, "CallOut", [], english="Call out"),
+            RawNode(1, InsType.SORT, "", "Sort: GI_1", template_id=""),
+            # template without a handler for the node type
+            RawNode(1, InsType.SORT, "", "Sort: GI_1", template_id="JUMP"),
+            # handler raises: the error text is returned and stored on the node
+            ArithmeticNode(1, InsType.DEF_INS_TYPE_ARITHEMETIC, _raw("GI_3"), "+", _raw("GI_4"), None,
+                           template_id="ASSIGNMENT"),
+            JumpNode(1, InsType.DEF_INS_TYPE_NUMERIC_IF, template_id="JUMP", target=9),
+        ]
+
+    batch_nodes = nodes()
+    single_nodes = nodes()
+    batch = render_nodes(batch_nodes)
+    single = [render_node(node) for node in single_nodes]
+
+    assert batch == single
+    assert [n.english for n in batch_nodes] == [n.english for n in single_nodes]
+    assert "What?" in batch
+    assert "Call out" in batch
+
+
+def test_finalize_falls_back_to_what_for_missing_template():
+    func = FunctionNode(1, InsType.DEF_INS_TYPE_CALL, "CallOut", [])
+    raw = RawNode(1, InsType.SORT, "", "Sort: GI_1", template_id="")
+
+    assert finalize([func, raw]) == [func, raw]
+    assert func.english == "What?"
+    assert raw.english == ""
+
+
+def test_finalize_keeps_english_preset_on_a_node_without_template():
+    func = FunctionNode(1, InsType.DEF_INS_TYPE_CALL, "CallOut", [], english="Call out")
+
+    finalize([func])
+
+    assert func.english == "Call out"
+
+
+def test_decode_ins_call_without_template_renders_what():
+    ast = decode_ins({"n": 1, "t": 2, "ins": "ABC", "ins_tar": "", "seq_t": 2, "seq_f": 2})
+
+    assert [type(n) for n in ast] == [FunctionNode]
+    assert ast[0].english == "What?"
+
+
+def test_templates_is_one_mapping_over_every_template_id():
+    ids = list(renderer._load_cfg()["templates"])
+    templates = renderer._LazyTemplates(dict.fromkeys(ids, "{{ target }}"), None)
+
+    # membership, iteration and len() all see every id before anything is compiled
+    assert all(tpl_id in templates for tpl_id in ids)
+    assert list(templates) == list(templates.keys()) == ids
+    assert len(templates) == len(ids)
+    assert "NOT_A_TEMPLATE" not in templates
+    assert templates.get("NOT_A_TEMPLATE") is None
+    assert templates._compiled == {}
+
+    assert templates[ids[0]] is templates[ids[0]]
+    assert list(templates._compiled) == [ids[0]]
+    assert renderer.TEMPLATES.keys() == set(ids)
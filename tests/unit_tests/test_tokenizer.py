@@ -0,0 +1,36 @@
+import pytest
+
+from enterprise_rating.ast_decoder.ast_nodes import FunctionNode
+from enterprise_rating.ast_decoder.decoder import decode_ins
+from enterprise_rating.ast_decoder.defs import InsType
+from enterprise_rating.ast_decoder.tokenizer import TOK_WORD, Token, tokenize
+
+
+@pytest.mark.parametrize(
+    ("ins_type", "raw", "values"),
+    [
+        (InsType.DEF_INS_TYPE_ARITHEMETIC, "GI_1*GI_2", ["GI_1*GI_2"]),  # tokenize_default
+        (InsType.INS_RANK_CATEGORY_INSTANCE, "|~GI_5|GC_6|", ["", "~GI_5", "GC_6", ""]),  # tokenize_pipe
+        (InsType.INS_SUM, "GI_1+GI_2", ["GI_1", "GI_2"]),  # tokenize_plus
+        (InsType.DEF_INS_TYPE_MASK, "GI_1|X|Y", ["GI_1", "X|Y"]),  # tokenize_pipe_first
+        (InsType.INS_FLAG_ALL_BY_USAGE_SET, "U|~GI_1|GI_2", ["GI_1", "GI_2"]),  # tokenize_rank_usage_set
+    ],
+)
+def test_splitting_tokenizers_return_word_tokens(ins_type: InsType, raw: str, values: list[str]):
+    assert tokenize(raw, ins_type, None) == [Token(TOK_WORD, v) for v in values]
+
+
+@pytest.mark.parametrize(
+    ("ins_type", "ins", "args"),
+    [
+        (InsType.INS_MATH_FUNC_SQRT, "GI_5|!R2", ["GI_5"]),
+        (InsType.DATE_DIFF_DAYS, "GI_1|GI_2", ["GI_1", "GI_2"]),
+        (InsType.INS_DATE_ADDITION, "GI_1|{30}", ["GI_1", "{30}"]),
+        (InsType.INS_QUERY_DATA_SOURCE, "DS_1|GI_2", ["DS_1", "GI_2"]),
+    ],
+)
+def test_decode_ins_pipe_delimited_function_args(ins_type: InsType, ins: str, args: list[str]):
+    node = decode_ins({"n": 1, "t": ins_type.value, "ins": ins, "seq_t": 2, "seq_f": 2})[0]
+
+    assert isinstance(node, FunctionNode)
+    assert [arg.raw for arg in node.args] == args
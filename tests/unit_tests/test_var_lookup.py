@@ -0,0 +1,67 @@
+from enterprise_rating.ast_decoder.helpers.var_lookup import (
+    desc_cache_scope,
+    get_var_desc,
+    get_var_desc_cached,
+)
+from enterprise_rating.entities.dependency import ResultVariable
+
+
+def _result_var(description: str) -> ResultVariable:
+    return ResultVariable(ib_type="8", category_id="1", description=description, index=5)
+
+
+def test_get_var_desc_cached_sees_mutated_deps_between_calls():
+    deps = [_result_var("Premium")]
+    assert get_var_desc_cached("GR_5", None, deps) == "Premium"
+
+    deps[0].description = "Net Premium"
+    assert get_var_desc_cached("GR_5", None, deps) == "Net Premium"
+
+
+def test_desc_cache_scope_is_dropped_on_exit():
+    deps = [_result_var("Premium")]
+    with desc_cache_scope():
+        assert get_var_desc_cached("GR_5", None, deps) == "Premium"
+
+    deps[0].description = "Net Premium"
+    with desc_cache_scope():
+        assert get_var_desc_cached("GR_5", None, deps) == "Net Premium"
+
+
+def test_desc_cache_scope_matches_uncached_lookup():
+    deps = [_result_var("Premium")]
+    values = ["GR_5", "~GR_5", "GR_6", "LS_3", "=", "{abc}", "plain"]
+    with desc_cache_scope():
+        cached = [get_var_desc_cached(v, None, deps) for v in values]
+        # second pass is served from the memo
+        assert [get_var_desc_cached(v, None, deps) for v in values] == cached
+    assert cached == [get_var_desc(v, None, deps) for v in values]
+
+
+def test_dependency_lookup_sees_replaced_deps_between_calls():
+    deps = [_result_var("Premium")]
+    assert get_var_desc_cached("GR_5", None, deps) == "Premium"
+
+    deps[0] = _result_var("Net Premium")
+    assert get_var_desc_cached("GR_5", None, deps) == "Net Premium"
+
+    deps.clear()
+    assert get_var_desc_cached("GR_5", None, deps) == "GR_5"
+
+
+def test_dependency_lookup_is_rebuilt_per_scope():
+    deps = [_result_var("Premium")]
+    with desc_cache_scope():
+        assert get_var_desc("GR_5", None, deps) == "Premium"
+
+    deps[0] = _result_var("Net Premium")
+    with desc_cache_scope():
+        assert get_var_desc("GR_5", None, deps) == "Net Premium"
+
+
+def test_dependency_lookup_returns_first_match_with_and_without_scope():
+    deps = [_result_var("Premium"), _result_var("Net Premium")]
+    assert get_var_desc("GR_5", None, deps) == "Premium"
+
+    with desc_cache_scope():
+        assert get_var_desc("GR_5", None, deps) == "Premium"